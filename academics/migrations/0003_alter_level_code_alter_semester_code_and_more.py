@@ -0,0 +1,31 @@
+# Generated by Django 5.2.17 on 2026-08-26 06:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0002_create_default_data'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='level',
+            name='code',
+            field=models.CharField(help_text='Unique level code (e.g., L1, L2, L3, L4)', max_length=10, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='semester',
+            name='code',
+            field=models.CharField(help_text='Unique semester code (e.g., FALL, SPRING, SUMMER)', max_length=20, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='level',
+            index=models.Index(fields=['is_active', 'order'], name='academics_l_is_acti_0fa376_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='semester',
+            index=models.Index(fields=['is_active', 'order'], name='academics_s_is_acti_f4d098_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-26 06:20
+
+import core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0003_alter_level_code_alter_semester_code_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='level',
+            name='id',
+            field=models.UUIDField(default=core.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='semester',
+            name='id',
+            field=models.UUIDField(default=core.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
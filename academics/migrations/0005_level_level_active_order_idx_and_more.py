@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-26 06:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0004_alter_level_id_alter_semester_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='level',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='level_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='semester',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='semester_active_order_idx'),
+        ),
+    ]
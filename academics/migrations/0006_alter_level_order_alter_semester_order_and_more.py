@@ -0,0 +1,31 @@
+# Generated by Django 5.2.17 on 2026-08-26 06:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0005_level_level_active_order_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='level',
+            name='order',
+            field=models.PositiveIntegerField(help_text='Display order (1, 2, 3, 4)'),
+        ),
+        migrations.AlterField(
+            model_name='semester',
+            name='order',
+            field=models.PositiveIntegerField(help_text='Display order within academic year'),
+        ),
+        migrations.AddIndex(
+            model_name='level',
+            index=models.Index(fields=['order'], name='academics_l_order_b4083c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='semester',
+            index=models.Index(fields=['order'], name='academics_s_order_5954cf_idx'),
+        ),
+    ]
@@ -1,16 +1,22 @@
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
+from django.db.models.signals import post_delete, post_save
 from core.models import UUIDModel, TimestampedModel
-from core.constants import LevelCode, SemesterCode
+from core.constants import (
+    LevelCode,
+    SemesterCode,
+    get_all_levels_config,
+    get_all_semesters_config,
+)
 from typing import Optional
 
 
 class LevelQuerySet(QuerySet):
     """Custom QuerySet for Level model"""
-    
+
     def active(self):
-        """Get only active levels"""
-        return self.filter(is_active=True)
+        """Get only active levels, projected to the display columns"""
+        return self.filter(is_active=True).only('id', 'code', 'name', 'order')
     
     def ordered(self):
         """Get levels ordered by order field"""
@@ -25,23 +31,25 @@ class LevelManager(models.Manager):
         return LevelQuerySet(self.model, using=self._db)
     
     def active(self):
-        """Get active levels ordered"""
-        return self.get_queryset().active().ordered()
-    
+        """Get active levels (Meta.ordering already sorts by order)"""
+        return self.get_queryset().active()
+
+    def cached_map(self) -> dict:
+        """Return the in-process {code: Level} map, loading it on first use"""
+        return _level_map()
+
     def get_by_code(self, code: str) -> Optional['Level']:
         """
         Get level by code.
-        
+        Cached in-process - the level table is tiny and effectively static.
+
         Args:
             code: Level code (L1, L2, etc.)
-            
+
         Returns:
             Level instance or None
         """
-        try:
-            return self.get(code=code)
-        except Level.DoesNotExist:
-            return None
+        return self.cached_map().get(code)
 
 
 class Level(UUIDModel, TimestampedModel):
@@ -51,8 +59,7 @@ class Level(UUIDModel, TimestampedModel):
     """
     code = models.CharField(
         max_length=10,
-        unique=True,
-        db_index=True,
+        unique=True,  # unique already creates an index - no separate db_index needed
         help_text="Unique level code (e.g., L1, L2, L3, L4)"
     )
     name = models.CharField(
@@ -64,7 +71,6 @@ class Level(UUIDModel, TimestampedModel):
         help_text="Detailed description of the level"
     )
     order = models.PositiveIntegerField(
-        unique=True,
         help_text="Display order (1, 2, 3, 4)"
     )
     is_active = models.BooleanField(
@@ -79,6 +85,15 @@ class Level(UUIDModel, TimestampedModel):
         verbose_name = 'Level'
         verbose_name_plural = 'Levels'
         db_table = 'academics_level'
+        indexes = [
+            models.Index(fields=['order']),
+            models.Index(fields=['is_active', 'order']),
+            models.Index(
+                fields=['order'],
+                condition=Q(is_active=True),
+                name='level_active_order_idx'
+            ),
+        ]
     
     def __str__(self) -> str:
         return f"{self.name} ({self.code})"
@@ -88,29 +103,32 @@ class Level(UUIDModel, TimestampedModel):
         """
         Create default levels from centralized configuration.
         Idempotent - safe to call multiple times.
+        Uses a single bulk INSERT; existing rows are skipped via the
+        unique constraint on code.
         """
-        from core.constants import get_all_levels_config
-        
         levels_config = get_all_levels_config()
-        
-        for code, config in levels_config.items():
-            cls.objects.get_or_create(
-                code=config['code'],
-                defaults={
-                    'name': config['name'],
-                    'description': config['description'],
-                    'order': config['order'],
-                    'is_active': config['is_active'],
-                }
-            )
+
+        cls.objects.bulk_create(
+            [
+                cls(
+                    code=config['code'],
+                    name=config['name'],
+                    description=config['description'],
+                    order=config['order'],
+                    is_active=config['is_active'],
+                )
+                for config in levels_config.values()
+            ],
+            ignore_conflicts=True
+        )
 
 
 class SemesterQuerySet(QuerySet):
     """Custom QuerySet for Semester model"""
-    
+
     def active(self):
-        """Get only active semesters"""
-        return self.filter(is_active=True)
+        """Get only active semesters, projected to the display columns"""
+        return self.filter(is_active=True).only('id', 'code', 'name', 'order')
     
     def ordered(self):
         """Get semesters ordered by order field"""
@@ -125,23 +143,25 @@ class SemesterManager(models.Manager):
         return SemesterQuerySet(self.model, using=self._db)
     
     def active(self):
-        """Get active semesters ordered"""
-        return self.get_queryset().active().ordered()
-    
+        """Get active semesters (Meta.ordering already sorts by order)"""
+        return self.get_queryset().active()
+
+    def cached_map(self) -> dict:
+        """Return the in-process {code: Semester} map, loading it on first use"""
+        return _semester_map()
+
     def get_by_code(self, code: str) -> Optional['Semester']:
         """
         Get semester by code.
-        
+        Cached in-process - the semester table is tiny and effectively static.
+
         Args:
             code: Semester code (FALL, SPRING, SUMMER)
-            
+
         Returns:
             Semester instance or None
         """
-        try:
-            return self.get(code=code)
-        except Semester.DoesNotExist:
-            return None
+        return self.cached_map().get(code)
 
 
 class Semester(UUIDModel, TimestampedModel):
@@ -151,8 +171,7 @@ class Semester(UUIDModel, TimestampedModel):
     """
     code = models.CharField(
         max_length=20,
-        unique=True,
-        db_index=True,
+        unique=True,  # unique already creates an index - no separate db_index needed
         help_text="Unique semester code (e.g., FALL, SPRING, SUMMER)"
     )
     name = models.CharField(
@@ -164,7 +183,6 @@ class Semester(UUIDModel, TimestampedModel):
         help_text="Detailed description of the semester"
     )
     order = models.PositiveIntegerField(
-        unique=True,
         help_text="Display order within academic year"
     )
     duration_weeks = models.PositiveIntegerField(
@@ -184,6 +202,15 @@ class Semester(UUIDModel, TimestampedModel):
         verbose_name = 'Semester'
         verbose_name_plural = 'Semesters'
         db_table = 'academics_semester'
+        indexes = [
+            models.Index(fields=['order']),
+            models.Index(fields=['is_active', 'order']),
+            models.Index(
+                fields=['order'],
+                condition=Q(is_active=True),
+                name='semester_active_order_idx'
+            ),
+        ]
     
     def __str__(self) -> str:
         return f"{self.name} ({self.code})"
@@ -193,19 +220,65 @@ class Semester(UUIDModel, TimestampedModel):
         """
         Create default semesters from centralized configuration.
         Idempotent - safe to call multiple times.
+        Uses a single bulk INSERT; existing rows are skipped via the
+        unique constraint on code.
         """
-        from core.constants import get_all_semesters_config
-        
         semesters_config = get_all_semesters_config()
-        
-        for code, config in semesters_config.items():
-            cls.objects.get_or_create(
-                code=config['code'],
-                defaults={
-                    'name': config['name'],
-                    'description': config['description'],
-                    'order': config['order'],
-                    'duration_weeks': config['duration_weeks'],
-                    'is_active': config['is_active'],
-                }
-            )
+
+        cls.objects.bulk_create(
+            [
+                cls(
+                    code=config['code'],
+                    name=config['name'],
+                    description=config['description'],
+                    order=config['order'],
+                    duration_weeks=config['duration_weeks'],
+                    is_active=config['is_active'],
+                )
+                for config in semesters_config.values()
+            ],
+            ignore_conflicts=True
+        )
+
+
+# ==============================================================================
+# In-process lookup caches
+# ==============================================================================
+# Levels and semesters are tiny, effectively static lookup tables, so the
+# whole table is cached per-process as a {code: instance} map and invalidated
+# whenever a row changes. Code lookups bypass the query compiler entirely.
+
+_level_cache: dict = {}
+_semester_cache: dict = {}
+
+
+def _level_map() -> dict:
+    """Load all levels into the cache on first access"""
+    if not _level_cache:
+        _level_cache.update({level.code: level for level in Level.objects.all()})
+    return _level_cache
+
+
+def _semester_map() -> dict:
+    """Load all semesters into the cache on first access"""
+    if not _semester_cache:
+        _semester_cache.update(
+            {semester.code: semester for semester in Semester.objects.all()}
+        )
+    return _semester_cache
+
+
+def _clear_level_cache(**kwargs):
+    """Invalidate the level lookup cache on any write"""
+    _level_cache.clear()
+
+
+def _clear_semester_cache(**kwargs):
+    """Invalidate the semester lookup cache on any write"""
+    _semester_cache.clear()
+
+
+post_save.connect(_clear_level_cache, sender=Level)
+post_delete.connect(_clear_level_cache, sender=Level)
+post_save.connect(_clear_semester_cache, sender=Semester)
+post_delete.connect(_clear_semester_cache, sender=Semester)
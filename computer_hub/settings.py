@@ -53,11 +53,17 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "core.middleware.AuditBatchMiddleware",  # Coalesce audit entries per request
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",  # Runs first, creates lazy user
-    "users.middleware.SupabaseAuthenticationMiddleware",  # Runs after, overrides lazy user's wrapped value
+    # Supabase auth resolves the user once, eagerly, and memoizes it on
+    # request._cached_user. AuthenticationMiddleware (kept only because the
+    # admin system check requires it) then resolves its lazy user from that
+    # cache instead of hitting the session backend - one user fetch per
+    # request.
+    "users.middleware.SupabaseAuthenticationMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -2,6 +2,8 @@
 Pytest configuration and fixtures for the entire project.
 Provides shared test fixtures and database setup.
 """
+import uuid
+
 import pytest
 from typing import Callable
 from rest_framework.test import APIClient
@@ -10,11 +12,36 @@ from users.services.role_service import RoleService
 from core.constants import UserRole
 
 
+# Canonical test users created once per session.
+# Per-test transactions roll back any mutation, so tests can freely modify them.
+_SESSION_USERS = {
+    'guest': ('guest@example.com', 'Guest User', []),
+    'student': ('student@example.com', 'Student User', []),
+    'instructor': ('instructor@example.com', 'Instructor User', [UserRole.INSTRUCTOR.value]),
+    'admin': ('admin@example.com', 'Admin User', [UserRole.ADMIN.value]),
+}
+
+
+def _seed_session_users() -> None:
+    """Create the canonical test users if missing (idempotent for --reuse-db)"""
+    for email, display_name, extra_roles in _SESSION_USERS.values():
+        user = User.objects.filter(email=email).first()
+        if user is None:
+            user = User.objects.create_user(
+                supabase_id=str(uuid.uuid4()),
+                email=email,
+                display_name=display_name
+            )
+        for role_name in extra_roles:
+            RoleService.assign_role(user, role_name)
+
+
 @pytest.fixture(scope='session')
 def django_db_setup(django_db_setup, django_db_blocker):
-    """Initialize database with default roles"""
+    """Initialize database with default roles and canonical test users"""
     with django_db_blocker.unblock():
         RoleService.initialize_default_roles()
+        _seed_session_users()
 
 
 @pytest.fixture
@@ -36,9 +63,8 @@ def create_user(db) -> Callable:
         **kwargs
     ) -> User:
         if not supabase_id:
-            import uuid
-            supabase_id = str(uuid.uuid4())
-        
+            supabase_id = uuid.uuid4().hex
+
         return User.objects.create_user(
             supabase_id=supabase_id,
             email=email,
@@ -49,61 +75,59 @@ def create_user(db) -> Callable:
     return _create_user
 
 
-@pytest.fixture
-def guest_user(create_user) -> User:
-    """Create a guest user"""
-    user = create_user(
-        email="guest@example.com",
-        display_name="Guest User"
+def _fetch_session_user(key: str) -> User:
+    """
+    Load a canonical user with roles and profile already attached, the
+    same shape the middleware hands to views. Tests that walk
+    user->roles->profile then serve assertions from the prefetch instead
+    of issuing a join per call.
+    """
+    return User.objects.with_roles().select_related('profile').get(
+        email=_SESSION_USERS[key][0]
     )
-    # Guest role is not assigned by default, user only has Student role
-    return user
 
 
 @pytest.fixture
-def student_user(create_user) -> User:
-    """Create a student user (default role)"""
-    return create_user(
-        email="student@example.com",
-        display_name="Student User"
-    )
+def guest_user(db) -> User:
+    """Return the session-seeded guest user"""
+    # Guest role is not assigned by default, user only has Student role.
+    # Deliberately not prefetched: guest tests delete role rows mid-test
+    # and must see the change on the next permission check.
+    return User.objects.get(email=_SESSION_USERS['guest'][0])
 
 
 @pytest.fixture
-def instructor_user(create_user) -> User:
-    """Create an instructor user"""
-    user = create_user(
-        email="instructor@example.com",
-        display_name="Instructor User"
-    )
-    RoleService.assign_role(user, UserRole.INSTRUCTOR.value)
-    return user
+def student_user(db) -> User:
+    """Return the session-seeded student user (default role)"""
+    return _fetch_session_user('student')
 
 
 @pytest.fixture
-def admin_user(create_user) -> User:
-    """Create an admin user"""
-    user = create_user(
-        email="admin@example.com",
-        display_name="Admin User"
-    )
-    RoleService.assign_role(user, UserRole.ADMIN.value)
-    return user
+def instructor_user(db) -> User:
+    """Return the session-seeded instructor user"""
+    return _fetch_session_user('instructor')
+
+
+@pytest.fixture
+def admin_user(db) -> User:
+    """Return the session-seeded admin user"""
+    return _fetch_session_user('admin')
 
 
 @pytest.fixture
 def authenticated_client(api_client: APIClient) -> Callable:
     """
     Factory fixture for authenticated API clients.
-    Returns a function that creates authenticated clients for given users.
+    Reuses the per-test client instead of instantiating a new APIClient
+    per authentication; credentials are reset on teardown.
     """
     def _authenticated_client(user: User) -> APIClient:
-        """Authenticate API client as the given user"""
-        client = APIClient()
-        client.force_authenticate(user=user)
-        return client
-    
-    return _authenticated_client
+        """Authenticate the shared API client as the given user"""
+        api_client.force_authenticate(user=user)
+        return api_client
+
+    yield _authenticated_client
+    api_client.force_authenticate(user=None)
 
 
 @pytest.fixture
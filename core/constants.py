@@ -1,33 +1,60 @@
 # Centralized constants and enums for the entire application.
-from enum import Enum
+from enum import StrEnum
+from types import MappingProxyType
 from typing import List, Tuple
 
 
-class BaseEnum(Enum):
-    """Base enum with helper methods for Django integration"""
-    
+class BaseEnum(StrEnum):
+    """
+    Base enum with helper methods for Django integration.
+    Members are strings (StrEnum), so they compare equal to their values
+    and can be passed directly wherever a plain string is expected.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute display labels and lookup structures at class creation"""
+        super().__init_subclass__(**kwargs)
+        for bit_index, item in enumerate(cls):
+            item._label = item.name.replace('_', ' ').title()
+            item._bit = 1 << bit_index
+        cls._CHOICES = tuple((item.value, item._label) for item in cls)
+        cls._VALUES = tuple(value for value, _ in cls._CHOICES)
+        cls._VALUE_SET = frozenset(cls._VALUES)
+        cls._DISPLAY_MAP = dict(cls._CHOICES)
+
+    @property
+    def label(self) -> str:
+        """Human-readable display label, computed once at class creation"""
+        return self._label
+
+    @property
+    def bit(self) -> int:
+        """
+        Unique power-of-two flag for this member.
+        Role sets collapse to an int bitmask, so membership checks on hot
+        paths (permission classes) are a single integer AND.
+        """
+        return self._bit
+
     @classmethod
-    def choices(cls) -> List[Tuple[str, str]]:
+    def choices(cls) -> Tuple[Tuple[str, str], ...]:
         """Return Django-compatible choices tuple"""
-        return [(item.value, item.name.replace('_', ' ').title()) for item in cls]
-    
+        return cls._CHOICES
+
     @classmethod
     def values(cls) -> List[str]:
         """Return list of all enum values"""
-        return [item.value for item in cls]
-    
+        return list(cls._VALUES)
+
     @classmethod
     def has_value(cls, value: str) -> bool:
         """Check if value exists in enum"""
-        return value in cls.values()
-    
+        return value in cls._VALUE_SET
+
     @classmethod
     def get_display(cls, value: str) -> str:
         """Get display name for a value"""
-        for item in cls:
-            if item.value == value:
-                return item.name.replace('_', ' ').title()
-        return value
+        return cls._DISPLAY_MAP.get(value, value)
 
 
 class UserRole(BaseEnum):
@@ -133,10 +160,10 @@ MAX_FILE_SIZE_MB = 50
 MAX_VIDEO_SIZE_MB = 500
 MAX_IMAGE_SIZE_MB = 10
 
-# Allowed file extensions
-ALLOWED_FILE_EXTENSIONS = ['.pdf', '.docx', '.pptx', '.zip', '.txt', '.md', '.xlsx']
-ALLOWED_VIDEO_EXTENSIONS = ['.mp4', '.webm', '.mov', '.avi']
-ALLOWED_IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
+# Allowed file extensions (lowercase; frozenset for O(1) membership tests)
+ALLOWED_FILE_EXTENSIONS = frozenset({'.pdf', '.docx', '.pptx', '.zip', '.txt', '.md', '.xlsx'})
+ALLOWED_VIDEO_EXTENSIONS = frozenset({'.mp4', '.webm', '.mov', '.avi'})
+ALLOWED_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
 
 # Rating constraints
 MIN_RATING = 1
@@ -263,6 +290,16 @@ DEFAULT_ROLES_CONFIG = {
 }
 
 
+# Flatten the permission dicts to frozensets of granted permission names.
+# Membership testing becomes a single hash lookup and the False entries
+# carried no information - anything absent is simply not granted.
+for _config in DEFAULT_ROLES_CONFIG.values():
+    _config['permissions'] = frozenset(
+        name for name, granted in _config['permissions'].items() if granted
+    )
+del _config
+
+
 def get_role_config(role_name: str) -> dict:
     """
     Get role configuration by name.
@@ -276,19 +313,24 @@ def get_role_config(role_name: str) -> dict:
     Raises:
         ValueError: If role_name is invalid
     """
-    if role_name not in DEFAULT_ROLES_CONFIG:
+    config = DEFAULT_ROLES_CONFIG.get(role_name)
+    if config is None:
         raise ValueError(f"Invalid role: {role_name}. Valid roles: {list(DEFAULT_ROLES_CONFIG.keys())}")
-    return DEFAULT_ROLES_CONFIG[role_name]
+    return config
+
+
+# Read-only view shared by all callers - avoids copying the dict on every call
+_ROLES_CONFIG_VIEW = MappingProxyType(DEFAULT_ROLES_CONFIG)
 
 
 def get_all_roles_config() -> dict:
     """
     Get all default role configurations.
-    
+
     Returns:
-        Dictionary mapping role names to their configurations
+        Read-only mapping of role names to their configurations
     """
-    return DEFAULT_ROLES_CONFIG.copy()
+    return _ROLES_CONFIG_VIEW
 
 
 # ==============================================================================
@@ -296,30 +338,40 @@ def get_all_roles_config() -> dict:
 # ==============================================================================
 # Define academic levels and semesters once, use everywhere
 
+# Bind the code strings once - the dict literals below reference each code
+# twice, and member attribute access costs add up at import time
+_L1 = LevelCode.LEVEL_1.value
+_L2 = LevelCode.LEVEL_2.value
+_L3 = LevelCode.LEVEL_3.value
+_L4 = LevelCode.LEVEL_4.value
+_FALL = SemesterCode.FALL.value
+_SPRING = SemesterCode.SPRING.value
+_SUMMER = SemesterCode.SUMMER.value
+
 DEFAULT_LEVELS_CONFIG = {
-    LevelCode.LEVEL_1.value: {
-        'code': LevelCode.LEVEL_1.value,
+    _L1: {
+        'code': _L1,
         'name': 'Level 1',
         'description': 'First year undergraduate level',
         'order': 1,
         'is_active': True,
     },
-    LevelCode.LEVEL_2.value: {
-        'code': LevelCode.LEVEL_2.value,
+    _L2: {
+        'code': _L2,
         'name': 'Level 2',
         'description': 'Second year undergraduate level',
         'order': 2,
         'is_active': True,
     },
-    LevelCode.LEVEL_3.value: {
-        'code': LevelCode.LEVEL_3.value,
+    _L3: {
+        'code': _L3,
         'name': 'Level 3',
         'description': 'Third year undergraduate level',
         'order': 3,
         'is_active': True,
     },
-    LevelCode.LEVEL_4.value: {
-        'code': LevelCode.LEVEL_4.value,
+    _L4: {
+        'code': _L4,
         'name': 'Level 4',
         'description': 'Fourth year undergraduate level',
         'order': 4,
@@ -328,24 +380,24 @@ DEFAULT_LEVELS_CONFIG = {
 }
 
 DEFAULT_SEMESTERS_CONFIG = {
-    SemesterCode.FALL.value: {
-        'code': SemesterCode.FALL.value,
+    _FALL: {
+        'code': _FALL,
         'name': 'Fall Semester',
         'description': 'Fall semester (September - December)',
         'order': 1,
         'duration_weeks': 16,
         'is_active': True,
     },
-    SemesterCode.SPRING.value: {
-        'code': SemesterCode.SPRING.value,
+    _SPRING: {
+        'code': _SPRING,
         'name': 'Spring Semester',
         'description': 'Spring semester (February - May)',
         'order': 2,
         'duration_weeks': 16,
         'is_active': True,
     },
-    SemesterCode.SUMMER.value: {
-        'code': SemesterCode.SUMMER.value,
+    _SUMMER: {
+        'code': _SUMMER,
         'name': 'Summer Semester',
         'description': 'Summer semester (June - August)',
         'order': 3,
@@ -368,14 +420,18 @@ def get_level_config(code: str) -> dict:
     Raises:
         ValueError: If code is invalid
     """
-    if code not in DEFAULT_LEVELS_CONFIG:
+    config = DEFAULT_LEVELS_CONFIG.get(code)
+    if config is None:
         raise ValueError(f"Invalid level code: {code}. Valid codes: {list(DEFAULT_LEVELS_CONFIG.keys())}")
-    return DEFAULT_LEVELS_CONFIG[code]
+    return config
+
+
+_LEVELS_CONFIG_VIEW = MappingProxyType(DEFAULT_LEVELS_CONFIG)
 
 
 def get_all_levels_config() -> dict:
-    """Get all default level configurations"""
-    return DEFAULT_LEVELS_CONFIG.copy()
+    """Get all default level configurations as a shared read-only mapping"""
+    return _LEVELS_CONFIG_VIEW
 
 
 def get_semester_config(code: str) -> dict:
@@ -391,11 +447,15 @@ def get_semester_config(code: str) -> dict:
     Raises:
         ValueError: If code is invalid
     """
-    if code not in DEFAULT_SEMESTERS_CONFIG:
+    config = DEFAULT_SEMESTERS_CONFIG.get(code)
+    if config is None:
         raise ValueError(f"Invalid semester code: {code}. Valid codes: {list(DEFAULT_SEMESTERS_CONFIG.keys())}")
-    return DEFAULT_SEMESTERS_CONFIG[code]
+    return config
+
+
+_SEMESTERS_CONFIG_VIEW = MappingProxyType(DEFAULT_SEMESTERS_CONFIG)
 
 
 def get_all_semesters_config() -> dict:
-    """Get all default semester configurations"""
-    return DEFAULT_SEMESTERS_CONFIG.copy()
+    """Get all default semester configurations as a shared read-only mapping"""
+    return _SEMESTERS_CONFIG_VIEW
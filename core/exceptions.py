@@ -5,6 +5,7 @@ from rest_framework import status
 
 class BaseAppException(APIException):
     """Base exception for all custom application exceptions"""
+    __slots__ = ()
     status_code = status.HTTP_400_BAD_REQUEST
     default_detail = 'A business logic error occurred.'
     default_code = 'error'
@@ -12,6 +13,7 @@ class BaseAppException(APIException):
 
 class PermissionDeniedError(BaseAppException):
     """Raised when user lacks required permissions"""
+    __slots__ = ()
     status_code = status.HTTP_403_FORBIDDEN
     default_detail = 'You do not have permission to perform this action.'
     default_code = 'permission_denied'
@@ -19,6 +21,7 @@ class PermissionDeniedError(BaseAppException):
 
 class ResourceNotFoundError(BaseAppException):
     """Raised when a requested resource doesn't exist"""
+    __slots__ = ()
     status_code = status.HTTP_404_NOT_FOUND
     default_detail = 'The requested resource was not found.'
     default_code = 'not_found'
@@ -26,6 +29,7 @@ class ResourceNotFoundError(BaseAppException):
 
 class ValidationError(BaseAppException):
     """Raised when input validation fails"""
+    __slots__ = ()
     status_code = status.HTTP_400_BAD_REQUEST
     default_detail = 'Validation error occurred.'
     default_code = 'validation_error'
@@ -33,6 +37,7 @@ class ValidationError(BaseAppException):
 
 class DuplicateResourceError(BaseAppException):
     """Raised when attempting to create a duplicate resource"""
+    __slots__ = ()
     status_code = status.HTTP_409_CONFLICT
     default_detail = 'A resource with these attributes already exists.'
     default_code = 'duplicate_resource'
@@ -40,6 +45,7 @@ class DuplicateResourceError(BaseAppException):
 
 class InvalidStatusTransitionError(BaseAppException):
     """Raised when attempting an invalid status transition"""
+    __slots__ = ()
     status_code = status.HTTP_400_BAD_REQUEST
     default_detail = 'Invalid status transition.'
     default_code = 'invalid_status_transition'
@@ -47,6 +53,7 @@ class InvalidStatusTransitionError(BaseAppException):
 
 class AuthenticationError(BaseAppException):
     """Raised when authentication fails"""
+    __slots__ = ()
     status_code = status.HTTP_401_UNAUTHORIZED
     default_detail = 'Authentication failed.'
     default_code = 'authentication_failed'
@@ -54,18 +61,21 @@ class AuthenticationError(BaseAppException):
 
 class TokenExpiredError(AuthenticationError):
     """Raised when JWT token has expired"""
+    __slots__ = ()
     default_detail = 'Authentication token has expired.'
     default_code = 'token_expired'
 
 
 class InvalidTokenError(AuthenticationError):
     """Raised when JWT token is invalid"""
+    __slots__ = ()
     default_detail = 'Authentication token is invalid.'
     default_code = 'invalid_token'
 
 
 class FileUploadError(BaseAppException):
     """Raised when file upload fails"""
+    __slots__ = ()
     status_code = status.HTTP_400_BAD_REQUEST
     default_detail = 'File upload failed.'
     default_code = 'file_upload_error'
@@ -73,11 +83,13 @@ class FileUploadError(BaseAppException):
 
 class FileSizeExceededError(FileUploadError):
     """Raised when uploaded file exceeds size limit"""
+    __slots__ = ()
     default_detail = 'File size exceeds the allowed limit.'
     default_code = 'file_size_exceeded'
 
 
 class InvalidFileTypeError(FileUploadError):
     """Raised when uploaded file type is not allowed"""
+    __slots__ = ()
     default_detail = 'File type is not allowed.'
     default_code = 'invalid_file_type'
@@ -0,0 +1,28 @@
+import logging
+
+from core.services.audit_service import AuditService
+
+logger = logging.getLogger(__name__)
+
+
+class AuditBatchMiddleware:
+    """
+    Collects every audit entry a request produces into one batch and
+    hands it to the async flusher when the response is built. Without
+    this, each log_* call enqueues separately and the flusher sees
+    small, fragmented batches.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        AuditService.begin_batch()
+        try:
+            return self.get_response(request)
+        finally:
+            try:
+                AuditService.end_batch()
+            except Exception:
+                # Audit must never break the response
+                logger.exception("Failed to flush audit batch")
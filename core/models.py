@@ -1,9 +1,64 @@
 from django.db import models
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 from django.utils.text import slugify
 from typing import Optional
+import secrets
+import time
 import uuid
 
+# Resolved on first use so importing core.models never drags the audit
+# service (and its transitive imports) in at module load, while call sites
+# skip the per-call IMPORT_NAME/IMPORT_FROM bytecode
+AuditService = SimpleLazyObject(
+    lambda: __import__(
+        'core.services.audit_service', fromlist=['AuditService']
+    ).AuditService
+)
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+    Monotonically increasing keys keep B-tree inserts at the rightmost
+    leaf, avoiding the random page splits caused by UUID4 primary keys.
+    Existing UUID4 rows remain valid - the column type is unchanged.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = secrets.randbits(74)
+    value = (timestamp_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76                   # version 7
+    value |= (rand >> 62) << 64          # 12-bit rand_a
+    value |= 0b10 << 62                  # RFC 4122 variant
+    value |= rand & ((1 << 62) - 1)      # 62-bit rand_b
+    return uuid.UUID(int=value)
+
+
+# Publication status values resolved once on first use. The late binding
+# avoids importing core.constants at module load while keeping the per-call
+# cost of publish/unpublish/is_published down to a dict-free comparison -
+# is_published runs per row in template loops.
+_PUBLISHED_STATUS: Optional[str] = None
+_DRAFT_STATUS: Optional[str] = None
+
+
+def _published_status() -> str:
+    """Return ContentStatus.PUBLISHED.value, resolving it on first call"""
+    global _PUBLISHED_STATUS
+    if _PUBLISHED_STATUS is None:
+        from core.constants import ContentStatus
+        _PUBLISHED_STATUS = ContentStatus.PUBLISHED.value
+    return _PUBLISHED_STATUS
+
+
+def _draft_status() -> str:
+    """Return ContentStatus.DRAFT.value, resolving it on first call"""
+    global _DRAFT_STATUS
+    if _DRAFT_STATUS is None:
+        from core.constants import ContentStatus
+        _DRAFT_STATUS = ContentStatus.DRAFT.value
+    return _DRAFT_STATUS
+
 
 class TimestampedModel(models.Model):
     """
@@ -66,17 +121,64 @@ class SoftDeleteModel(TimestampedModel):
         Args:
             user: User performing the deletion (optional)
         """
+        if self.is_deleted:
+            # Already deleted - skip the redundant UPDATE (idempotent retries)
+            return
         self.is_deleted = True
         self.deleted_at = timezone.now()
         self.deleted_by = user
-        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_at'])
+        # deleted_at is the mutation timestamp here; leaving updated_at
+        # alone writes one less column (and avoids TOAST churn on wide rows)
+        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by'])
     
     def restore(self) -> None:
         """Restore a soft-deleted object"""
+        if not self.is_deleted:
+            # Nothing to restore - skip the redundant UPDATE
+            return
         self.is_deleted = False
         self.deleted_at = None
         self.deleted_by = None
-        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_at'])
+        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by'])
+
+    @classmethod
+    def bulk_soft_delete(cls, queryset, user: Optional['User'] = None) -> int:
+        """
+        Soft delete every row in the queryset with a single UPDATE.
+        Calling soft_delete() in a loop issues one UPDATE per row; bulk
+        admin selections should go through this instead.
+        Like soft_delete(), deleted_at serves as the mutation timestamp -
+        updated_at is left untouched.
+
+        Args:
+            queryset: Queryset of rows to soft delete
+            user: User performing the deletion (optional)
+
+        Returns:
+            Number of rows updated
+        """
+        return queryset.update(
+            is_deleted=True,
+            deleted_at=timezone.now(),
+            deleted_by=user
+        )
+
+    @classmethod
+    def bulk_restore(cls, queryset) -> int:
+        """
+        Restore every row in the queryset with a single UPDATE.
+
+        Args:
+            queryset: Queryset of rows to restore
+
+        Returns:
+            Number of rows updated
+        """
+        return queryset.update(
+            is_deleted=False,
+            deleted_at=None,
+            deleted_by=None
+        )
 
 
 class StatusModel(models.Model):
@@ -103,22 +205,20 @@ class StatusModel(models.Model):
             user: User performing the change (optional)
             reason: Reason for status change (optional)
         """
+        if new_status == self.status:
+            # No transition - avoid a no-op UPDATE and audit-log noise
+            return
         old_status = self.status
         self.status = new_status
         self.save(update_fields=['status', 'updated_at'])
-        
-        # Log status change if audit service is available
-        try:
-            from core.services.audit_service import AuditService
-            AuditService.log_status_change(
-                entity=self,
-                old_status=old_status,
-                new_status=new_status,
-                user=user,
-                reason=reason
-            )
-        except ImportError:
-            pass  # Audit service not yet implemented
+
+        AuditService.log_status_change(
+            entity=self,
+            old_status=old_status,
+            new_status=new_status,
+            user=user,
+            reason=reason
+        )
 
 
 class SlugModel(models.Model):
@@ -131,33 +231,66 @@ class SlugModel(models.Model):
     class Meta:
         abstract = True
     
-    def generate_slug(self, source_text: str, max_length: int = 255) -> str:
+    @classmethod
+    def _load_slug_cache(cls) -> set:
+        """
+        Load all existing slugs into a set.
+        Bulk callers pass this to generate_slug so N objects cost one
+        query instead of one query per uniqueness probe (O(N^2)).
+        """
+        return set(cls.objects.values_list('slug', flat=True))
+
+    def generate_slug(
+        self,
+        source_text: str,
+        max_length: int = 255,
+        slug_cache: Optional[set] = None
+    ) -> str:
         """
         Generate a unique slug from source text.
-        
+
         Args:
             source_text: Text to generate slug from
             max_length: Maximum slug length
-            
+            slug_cache: Optional set of taken slugs; when given, uniqueness
+                is probed against the set (no queries) and the chosen slug
+                is added to it
+
         Returns:
             Unique slug string
         """
         base_slug = slugify(source_text)[:max_length]
+
+        if slug_cache is None:
+            # Fetch every colliding candidate in one query, then probe in
+            # memory. Matching the exact base or 'base-' prefix keeps
+            # unrelated slugs that merely share a prefix out of the set.
+            slug_cache = set(
+                self.__class__.objects
+                .filter(
+                    models.Q(slug=base_slug) |
+                    models.Q(slug__startswith=f'{base_slug}-')
+                )
+                .exclude(pk=self.pk)
+                .values_list('slug', flat=True)
+            )
+
         slug = base_slug
         counter = 1
-        
+
         # Ensure uniqueness
-        while self.__class__.objects.filter(slug=slug).exclude(pk=self.pk).exists():
+        while slug in slug_cache:
             suffix = f'-{counter}'
             slug = f'{base_slug[:max_length - len(suffix)]}{suffix}'
             counter += 1
-        
+
+        slug_cache.add(slug)
         return slug
 
 
 class UUIDModel(models.Model):
-    """Abstract base class with UUID primary key"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    """Abstract base class with time-ordered UUID primary key"""
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     class Meta:
         abstract = True
@@ -185,6 +318,32 @@ class OrderedModel(models.Model):
         self.order_number += 1
         self.save(update_fields=['order_number'])
 
+    @classmethod
+    def reorder(cls, id_to_order: dict) -> int:
+        """
+        Apply new order numbers to many rows in a single UPDATE.
+        Bulk reordering (e.g. drag-and-drop in admin) should use this
+        instead of issuing one move_up/move_down UPDATE per row.
+
+        Args:
+            id_to_order: Mapping of primary key to new order_number
+
+        Returns:
+            Number of rows updated
+        """
+        if not id_to_order:
+            return 0
+
+        return cls.objects.filter(pk__in=id_to_order).update(
+            order_number=models.Case(
+                *[
+                    models.When(pk=pk, then=models.Value(order))
+                    for pk, order in id_to_order.items()
+                ],
+                output_field=models.PositiveIntegerField()
+            )
+        )
+
 
 class PublishableModel(StatusModel):
     """
@@ -205,18 +364,14 @@ class PublishableModel(StatusModel):
     
     def publish(self, user: Optional['User'] = None) -> None:
         """Publish this content"""
-        from core.constants import ContentStatus
-        
-        self.status = ContentStatus.PUBLISHED.value
+        self.status = _published_status()
         self.published_at = timezone.now()
         self.published_by = user
         self.save(update_fields=['status', 'published_at', 'published_by', 'updated_at'])
     
     def unpublish(self, user: Optional['User'] = None) -> None:
         """Unpublish this content"""
-        from core.constants import ContentStatus
-        
-        self.status = ContentStatus.DRAFT.value
+        self.status = _draft_status()
         self.published_at = None
         self.published_by = None
         self.save(update_fields=['status', 'published_at', 'published_by', 'updated_at'])
@@ -224,5 +379,4 @@ class PublishableModel(StatusModel):
     @property
     def is_published(self) -> bool:
         """Check if content is published"""
-        from core.constants import ContentStatus
-        return self.status == ContentStatus.PUBLISHED.value
+        return self.status == _published_status()
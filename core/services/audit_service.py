@@ -1,14 +1,99 @@
+import logging
+import queue
+import threading
 from typing import Optional, Any, Dict
 from django.db.models import Model
 from django.utils import timezone
 
+logger = logging.getLogger(__name__)
+
+# Audit entries are enqueued on the request thread and drained in batches
+# by a background daemon thread, keeping audit I/O off the critical path.
+_audit_queue: queue.Queue = queue.Queue(maxsize=10000)
+_flusher_lock = threading.Lock()
+_flusher_started = False
+
+_FLUSH_BATCH_SIZE = 512
+_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Per-request batching context. AuditBatchMiddleware sets .batch to a list
+# for the duration of a request so the several log_* calls a request makes
+# (status change, role assign, publish) reach the flusher as one batch.
+_local = threading.local()
+
+# AuditAction.UPDATE.value resolved once instead of an import + enum
+# attribute walk inside every log_* call
+_UPDATE_ACTION: Optional[str] = None
+
+
+def _update_action() -> str:
+    """Return AuditAction.UPDATE.value, resolving it on first call"""
+    global _UPDATE_ACTION
+    if _UPDATE_ACTION is None:
+        from core.constants import AuditAction
+        _UPDATE_ACTION = AuditAction.UPDATE.value
+    return _UPDATE_ACTION
+
+
+def _collect_batch() -> list:
+    """Block briefly for the first entry, then drain up to a full batch"""
+    batch = []
+    try:
+        batch.append(_audit_queue.get(timeout=_FLUSH_INTERVAL_SECONDS))
+    except queue.Empty:
+        return batch
+
+    while len(batch) < _FLUSH_BATCH_SIZE:
+        try:
+            batch.append(_audit_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _write_batch(batch: list) -> None:
+    """
+    Persist a batch of audit entries.
+    Will become a single AuditLog.objects.bulk_create once that model
+    is implemented; until then entries go to the logger.
+    """
+    for entry in batch:
+        logger.debug(
+            "[AUDIT] %s on %s#%s by %s",
+            entry['action'], entry['entity_type'], entry['entity_pk'], entry['user_id']
+        )
+
+
+def _drain_forever() -> None:
+    """Background flusher loop (daemon thread)"""
+    while True:
+        batch = _collect_batch()
+        if batch:
+            _write_batch(batch)
+
+
+def _ensure_flusher() -> None:
+    """Start the background flusher thread on first use"""
+    global _flusher_started
+    if _flusher_started:
+        return
+    with _flusher_lock:
+        if not _flusher_started:
+            threading.Thread(
+                target=_drain_forever,
+                name='audit-flusher',
+                daemon=True
+            ).start()
+            _flusher_started = True
+
 
 class AuditService:
     """
     Service for audit logging.
+    Entries are queued and flushed in batches off the request thread.
     Will create AuditLog entries when that model is implemented.
     """
-    
+
     @staticmethod
     def log_action(
         entity: Model,
@@ -20,7 +105,7 @@ class AuditService:
     ) -> None:
         """
         Log an action to audit trail.
-        
+
         Args:
             entity: The model instance being acted upon
             action: Action being performed (from AuditAction enum)
@@ -29,12 +114,67 @@ class AuditService:
             new_data: New state (for updates)
             metadata: Additional context
         """
-        # TODO: Implement when AuditLog model is created
-        # For now, just log to console in debug mode
-        from django.conf import settings
-        if settings.DEBUG:
-            entity_type = f"{entity._meta.app_label}.{entity._meta.model_name}"
-            print(f"[AUDIT] {action} on {entity_type}#{entity.pk} by {user}")
+        _ensure_flusher()
+        entry = {
+            'entity_type': f"{entity._meta.app_label}.{entity._meta.model_name}",
+            'entity_pk': entity.pk,
+            'action': action,
+            'user_id': user.pk if user else None,
+            'old_data': old_data,
+            'new_data': new_data,
+            'metadata': metadata,
+            'timestamp': timezone.now(),
+        }
+
+        batch = getattr(_local, 'batch', None)
+        if batch is not None:
+            # Inside a request batch - coalesce and enqueue on response
+            batch.append(entry)
+            return
+
+        try:
+            _audit_queue.put_nowait(entry)
+        except queue.Full:
+            # Never block a request on audit logging - drop and report
+            logger.warning("Audit queue full, dropping entry: %s", entry['action'])
+
+    @staticmethod
+    def begin_batch() -> None:
+        """Start collecting this thread's entries into one batch"""
+        _local.batch = []
+
+    @staticmethod
+    def end_batch() -> None:
+        """
+        Hand the collected batch to the async flusher in one go.
+        Arriving together, the entries are drained as a single write
+        instead of trickling into the queue one log_* call at a time.
+        """
+        batch = getattr(_local, 'batch', None)
+        _local.batch = None
+        if not batch:
+            return
+        for entry in batch:
+            try:
+                _audit_queue.put_nowait(entry)
+            except queue.Full:
+                logger.warning(
+                    "Audit queue full, dropping entry: %s", entry['action']
+                )
+
+    @staticmethod
+    def flush() -> None:
+        """Drain any queued entries synchronously (used in test teardown)"""
+        while True:
+            batch = []
+            while len(batch) < _FLUSH_BATCH_SIZE:
+                try:
+                    batch.append(_audit_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            _write_batch(batch)
     
     @staticmethod
     def log_status_change(
@@ -45,12 +185,10 @@ class AuditService:
         reason: Optional[str] = None
     ) -> None:
         """Log status change"""
-        from core.constants import AuditAction
-        
         metadata = {'reason': reason} if reason else None
         AuditService.log_action(
             entity=entity,
-            action=AuditAction.UPDATE.value,
+            action=_update_action(),
             user=user,
             old_data={'status': old_status},
             new_data={'status': new_status},
@@ -64,13 +202,11 @@ class AuditService:
         assigned_by: Optional['User'] = None
     ) -> None:
         """Log role assignment to user"""
-        from core.constants import AuditAction
-        
         # Create a pseudo-entity for role assignment
         # TODO: Improve this when AuditLog model is ready
         AuditService.log_action(
             entity=user,
-            action=AuditAction.UPDATE.value,
+            action=_update_action(),
             user=assigned_by,
             new_data={'role_added': role.name}
         )
@@ -82,11 +218,9 @@ class AuditService:
         revoked_by: Optional['User'] = None
     ) -> None:
         """Log role revocation from user"""
-        from core.constants import AuditAction
-        
         AuditService.log_action(
             entity=user,
-            action=AuditAction.UPDATE.value,
+            action=_update_action(),
             user=revoked_by,
             old_data={'role_removed': role_name}
         )
@@ -94,11 +228,9 @@ class AuditService:
     @staticmethod
     def log_user_deactivation(user: 'User', deactivated_by: 'User') -> None:
         """Log user deactivation"""
-        from core.constants import AuditAction
-        
         AuditService.log_action(
             entity=user,
-            action=AuditAction.UPDATE.value,
+            action=_update_action(),
             user=deactivated_by,
             new_data={'is_active': False}
         )
@@ -106,11 +238,9 @@ class AuditService:
     @staticmethod
     def log_user_activation(user: 'User', activated_by: 'User') -> None:
         """Log user activation"""
-        from core.constants import AuditAction
-        
         AuditService.log_action(
             entity=user,
-            action=AuditAction.UPDATE.value,
+            action=_update_action(),
             user=activated_by,
             new_data={'is_active': True}
         )
@@ -3,10 +3,14 @@ Supabase Admin SDK Integration
 Provides admin-level operations for user management (password reset, email updates, etc.)
 """
 import os
-from typing import Optional, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, Iterator
 from django.conf import settings
 from supabase import create_client, Client
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class SupabaseAdminClient:
@@ -27,7 +31,43 @@ class SupabaseAdminClient:
         # Create admin client with service role key
         self.client = create_client(self.url, self.service_key)
         self.auth_api_url = f"{self.url}/auth/v1/admin"
-    
+
+        # Pooled session so repeated admin calls reuse keepalive connections
+        # instead of paying a TCP + TLS handshake per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504]
+            )
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._headers = {
+            'Authorization': f'Bearer {self.service_key}',
+            'apikey': self.service_key,
+            'Content-Type': 'application/json'
+        }
+
+    def close(self):
+        """Release pooled connections"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        try:
+            self._session.close()
+        except AttributeError:
+            pass  # __init__ raised before the session was created
+
     def _make_admin_request(
         self,
         method: str,
@@ -46,19 +86,15 @@ class SupabaseAdminClient:
             API response as dictionary
         """
         url = f"{self.auth_api_url}/{endpoint}"
-        headers = {
-            'Authorization': f'Bearer {self.service_key}',
-            'apikey': self.service_key,
-            'Content-Type': 'application/json'
-        }
-        
-        response = requests.request(
+
+        response = self._session.request(
             method=method,
             url=url,
             json=data,
-            headers=headers
+            headers=self._headers,
+            timeout=(3.05, 30)
         )
-        
+
         response.raise_for_status()
         return response.json() if response.content else {}
     
@@ -213,7 +249,51 @@ class SupabaseAdminClient:
             method='GET',
             endpoint=f'users?page={page}&per_page={per_page}'
         )
-    
+
+    def iter_all_users(self, per_page: int = 200) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every user in Supabase Auth.
+        The first page discovers the total count, then the remaining pages
+        are fetched concurrently over the pooled session, so full scans
+        (e.g., reconciliation jobs) take ~pages/workers round-trips
+        instead of one per page.
+
+        Args:
+            per_page: Users per page
+
+        Yields:
+            User data dictionaries
+        """
+        first_page = self.list_users(page=1, per_page=per_page)
+        users = first_page.get('users', [])
+        yield from users
+
+        total = first_page.get('total')
+        if total is not None:
+            last_page = -(-total // per_page)  # ceiling division
+        elif len(users) == per_page:
+            # Total unknown - fall back to sequential paging until a short page
+            page = 2
+            while True:
+                users = self.list_users(page=page, per_page=per_page).get('users', [])
+                yield from users
+                if len(users) < per_page:
+                    return
+                page += 1
+        else:
+            return
+
+        if last_page < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(self.list_users, page=page, per_page=per_page)
+                for page in range(2, last_page + 1)
+            ]
+            for future in as_completed(futures):
+                yield from future.result().get('users', [])
+
     def create_user(
         self,
         email: str,
@@ -285,20 +365,25 @@ class SupabaseAdminClient:
 
 # Singleton instance
 _admin_client: Optional[SupabaseAdminClient] = None
+_admin_client_lock = threading.Lock()
 
 
 def get_supabase_admin_client() -> SupabaseAdminClient:
     """
     Get or create Supabase admin client instance (singleton pattern).
-    
+    Double-checked locking so concurrent first calls build the client
+    (TLS setup included) exactly once.
+
     Returns:
         Configured SupabaseAdminClient instance
     """
     global _admin_client
-    
+
     if _admin_client is None:
-        _admin_client = SupabaseAdminClient()
-    
+        with _admin_client_lock:
+            if _admin_client is None:
+                _admin_client = SupabaseAdminClient()
+
     return _admin_client
 
 
@@ -1,10 +1,12 @@
 import os
+import threading
 from supabase import create_client, Client
 from django.conf import settings
 from typing import Optional
 
 
 _supabase_client: Optional[Client] = None
+_supabase_client_lock = threading.Lock()
 
 
 def get_supabase_client() -> Client:
@@ -25,19 +27,22 @@ def get_supabase_client() -> Client:
         Configured Supabase client
     """
     global _supabase_client
-    
+
     if _supabase_client is None:
-        url = settings.SUPABASE_URL
-        # Use ANON key (JWT format) - publishable keys might not be supported yet
-        key = getattr(settings, 'SUPABASE_ANON_KEY', None) or settings.SUPABASE_KEY
-        
-        if not url or not key:
-            raise ValueError(
-                "SUPABASE_URL and SUPABASE_ANON_KEY (or SUPABASE_KEY) must be set in environment variables"
-            )
-        
-        _supabase_client = create_client(url, key)
-    
+        # Double-checked locking: concurrent first calls build the client once
+        with _supabase_client_lock:
+            if _supabase_client is None:
+                url = settings.SUPABASE_URL
+                # Use ANON key (JWT format) - publishable keys might not be supported yet
+                key = getattr(settings, 'SUPABASE_ANON_KEY', None) or settings.SUPABASE_KEY
+
+                if not url or not key:
+                    raise ValueError(
+                        "SUPABASE_URL and SUPABASE_ANON_KEY (or SUPABASE_KEY) must be set in environment variables"
+                    )
+
+                _supabase_client = create_client(url, key)
+
     return _supabase_client
 
 
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-26 06:20
+
+import core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='courseprerequisite',
+            name='id',
+            field=models.UUIDField(default=core.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
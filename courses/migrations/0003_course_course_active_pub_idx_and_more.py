@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-26 06:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0006_alter_level_order_alter_semester_order_and_more'),
+        ('courses', '0002_alter_courseprerequisite_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_active', 'status'], name='course_active_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('status', 'published')), fields=['status'], name='course_published_idx'),
+        ),
+    ]
@@ -1,17 +1,70 @@
 from django.db import models
 from django.db.models import QuerySet, Q
 from django.utils.text import slugify
-from core.models import UUIDModel, TimestampedModel, SoftDeleteModel
+from academics.models import Level, Semester
+from core.models import UUIDModel, TimestampedModel, SoftDeleteModel, SoftDeleteManager
 from core.constants import CourseStatus
+from functools import lru_cache
 from typing import Optional
 
+# Seed scripts slugify thousands of code/name strings, many repeated across
+# retries; caching skips slugify's regex passes for strings already seen
+_slugify_cached = lru_cache(maxsize=4096)(slugify)
+
 
 class CourseQuerySet(QuerySet):
     """Custom QuerySet for Course model"""
-    
+
+    def with_academic_structure(self):
+        """
+        Join level and semester in the same query.
+        List views that render level/semester names must chain this to
+        avoid one query per course (N+1).
+        """
+        return self.select_related('level', 'semester')
+
+    def with_prerequisite_graph(self):
+        """
+        Prefetch prerequisites and dependent courses in two extra queries
+        total, regardless of page size. Looping over courses and calling
+        get_prerequisites()/get_dependent_courses() without this costs one
+        query per course.
+        """
+        return self.prefetch_related(
+            models.Prefetch(
+                'prerequisites',
+                queryset=CoursePrerequisite.objects.select_related('prerequisite').only(
+                    'course_id', 'prerequisite_id', 'is_mandatory', 'minimum_grade',
+                    'prerequisite__code', 'prerequisite__name'
+                )
+            ),
+            models.Prefetch(
+                'dependent_courses',
+                queryset=CoursePrerequisite.objects.select_related('course').only(
+                    'course_id', 'prerequisite_id', 'is_mandatory', 'minimum_grade',
+                    'course__code', 'course__name'
+                )
+            ),
+        )
+
+    def list_fields(self):
+        """
+        Project to the columns list views actually render.
+        Skips the description TEXT column, which is the widest field on
+        the table and pure dead weight for list pages.
+        """
+        return self.only(
+            'id', 'code', 'name', 'slug', 'credits',
+            'level_id', 'semester_id', 'status', 'is_elective'
+        )
+
     def active(self):
-        """Get only active courses (not soft-deleted)"""
-        return self.filter(is_active=True, deleted_at__isnull=True)
+        """
+        Get only active courses.
+        The default manager already excludes soft-deleted rows, so this
+        adds just the is_active predicate.
+        """
+        return self.filter(is_active=True)
     
     def published(self):
         """Get only published courses"""
@@ -28,8 +81,6 @@ class CourseQuerySet(QuerySet):
         Args:
             level: Level instance or level code
         """
-        from academics.models import Level
-        
         if isinstance(level, str):
             level = Level.objects.get_by_code(level)
         
@@ -42,8 +93,6 @@ class CourseQuerySet(QuerySet):
         Args:
             semester: Semester instance or semester code
         """
-        from academics.models import Semester
-        
         if isinstance(semester, str):
             semester = Semester.objects.get_by_code(semester)
         
@@ -58,13 +107,25 @@ class CourseQuerySet(QuerySet):
         return self.filter(is_elective=False)
 
 
-class CourseManager(models.Manager):
-    """Custom manager for Course model"""
-    
+class CourseManager(SoftDeleteManager):
+    """Custom manager for Course model, excluding soft-deleted courses"""
+
     def get_queryset(self):
-        """Return custom queryset"""
-        return CourseQuerySet(self.model, using=self._db)
-    
+        """Return custom queryset without soft-deleted courses"""
+        return CourseQuerySet(self.model, using=self._db).filter(is_deleted=False)
+
+    def with_academic_structure(self):
+        """Get courses with level and semester joined (for list views)"""
+        return self.get_queryset().with_academic_structure()
+
+    def with_prerequisite_graph(self):
+        """Get courses with prerequisite/dependent relations prefetched"""
+        return self.get_queryset().with_prerequisite_graph()
+
+    def list_fields(self):
+        """Get courses projected to the columns list views render"""
+        return self.get_queryset().list_fields()
+
     def active(self):
         """Get active courses"""
         return self.get_queryset().active()
@@ -193,6 +254,21 @@ class Course(SoftDeleteModel):
         indexes = [
             models.Index(fields=['level', 'semester']),
             models.Index(fields=['is_active', 'status']),
+            # Partial indexes covering the active()/published() hot paths;
+            # they only contain live rows, so they stay small and cached
+            models.Index(
+                fields=['is_active', 'status'],
+                condition=Q(is_deleted=False),
+                name='course_active_pub_idx'
+            ),
+            models.Index(
+                fields=['status'],
+                condition=Q(
+                    status=CourseStatus.PUBLISHED.value,
+                    is_deleted=False
+                ),
+                name='course_published_idx'
+            ),
         ]
     
     def __str__(self) -> str:
@@ -200,21 +276,71 @@ class Course(SoftDeleteModel):
     
     def save(self, *args, **kwargs):
         """Auto-generate slug if not provided"""
-        if not self.slug:
-            self.slug = slugify(f"{self.code}-{self.name}")
+        if self.slug:
+            # Slug already set - skip the slugify/f-string work entirely
+            super().save(*args, **kwargs)
+            return
+        self.slug = _slugify_cached(f"{self.code}-{self.name}")
         super().save(*args, **kwargs)
-    
+
+    @classmethod
+    def bulk_create_with_slugs(cls, objs, batch_size: int = 500):
+        """
+        Assign unique slugs in memory and insert all courses in one
+        bulk_create. Seeding N courses through save() costs N INSERTs
+        plus a slug computation each; this pays one slug-list query and
+        batched INSERTs instead.
+
+        Args:
+            objs: Unsaved Course instances
+            batch_size: Rows per INSERT batch
+
+        Returns:
+            The created Course instances
+        """
+        slug_cache = set(cls.objects.values_list('slug', flat=True))
+
+        for obj in objs:
+            if obj.slug:
+                continue
+            base_slug = _slugify_cached(f"{obj.code}-{obj.name}")[:250]
+            slug = base_slug
+            counter = 1
+            while slug in slug_cache:
+                suffix = f'-{counter}'
+                slug = f'{base_slug[:250 - len(suffix)]}{suffix}'
+                counter += 1
+            obj.slug = slug
+            slug_cache.add(slug)
+
+        return cls.objects.bulk_create(objs, batch_size=batch_size)
+
+
     @property
     def is_general(self) -> bool:
         """Check if this is a general course (not tied to level/semester)"""
         return self.level is None and self.semester is None
     
     def get_prerequisites(self):
-        """Get all prerequisites for this course"""
+        """
+        Get all prerequisites for this course.
+        Served from the prefetch cache when the queryset was built with
+        with_prerequisite_graph(); otherwise one query per call.
+        """
+        cache = getattr(self, '_prefetched_objects_cache', None)
+        if cache is not None and 'prerequisites' in cache:
+            return self.prerequisites.all()
         return CoursePrerequisite.objects.filter(course=self).select_related('prerequisite')
-    
+
     def get_dependent_courses(self):
-        """Get all courses that have this course as a prerequisite"""
+        """
+        Get all courses that have this course as a prerequisite.
+        Served from the prefetch cache when the queryset was built with
+        with_prerequisite_graph(); otherwise one query per call.
+        """
+        cache = getattr(self, '_prefetched_objects_cache', None)
+        if cache is not None and 'dependent_courses' in cache:
+            return self.dependent_courses.all()
         return CoursePrerequisite.objects.filter(prerequisite=self).select_related('course')
 
 
@@ -255,6 +381,57 @@ class CoursePrerequisite(UUIDModel, TimestampedModel):
             models.Index(fields=['prerequisite']),
         ]
     
+    @classmethod
+    def bulk_upsert(cls, edges: list[dict], batch_size: int = 500):
+        """
+        Insert or update prerequisite edges in a fixed number of queries.
+        Importing a prereq graph edge-by-edge costs one query per edge;
+        this pays one existence check, batched INSERTs for new edges, and
+        one UPDATE per distinct (is_mandatory, minimum_grade) pair for
+        existing ones.
+
+        Args:
+            edges: Dicts with course_id, prerequisite_id and optionally
+                is_mandatory / minimum_grade
+            batch_size: Rows per INSERT batch
+
+        Returns:
+            The newly created CoursePrerequisite instances
+        """
+        existing = {
+            (e['course_id'], e['prerequisite_id'])
+            for e in cls.objects.filter(
+                course_id__in={e['course_id'] for e in edges}
+            ).values('course_id', 'prerequisite_id')
+        }
+
+        to_create = []
+        to_update = {}
+        for edge in edges:
+            key = (edge['course_id'], edge['prerequisite_id'])
+            if key in existing:
+                values = (
+                    edge.get('is_mandatory', True),
+                    edge.get('minimum_grade', ''),
+                )
+                to_update.setdefault(values, []).append(key)
+            else:
+                to_create.append(cls(**edge))
+
+        created = cls.objects.bulk_create(
+            to_create, batch_size=batch_size, ignore_conflicts=True
+        )
+
+        for (is_mandatory, minimum_grade), keys in to_update.items():
+            predicate = Q()
+            for course_id, prerequisite_id in keys:
+                predicate |= Q(course_id=course_id, prerequisite_id=prerequisite_id)
+            cls.objects.filter(predicate).exclude(
+                is_mandatory=is_mandatory, minimum_grade=minimum_grade
+            ).update(is_mandatory=is_mandatory, minimum_grade=minimum_grade)
+
+        return created
+
     def __str__(self) -> str:
         mandatory = "Required" if self.is_mandatory else "Optional"
         grade_info = f" (Min: {self.minimum_grade})" if self.minimum_grade else ""
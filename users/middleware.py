@@ -1,9 +1,16 @@
 from django.utils.functional import SimpleLazyObject
 from django.contrib.auth.models import AnonymousUser
 from django.conf import settings
+from django.core.cache import cache
 from rest_framework import exceptions
+import base64
+import hashlib
+import hmac
+import json
 import jwt
 import logging
+import threading
+import time
 from typing import Optional
 from users.models import User
 from users.services.user_service import UserService
@@ -11,6 +18,119 @@ from core.utils.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+# Key material prepared once at import - encoding the secret per request
+# is pure overhead on an HS256-heavy workload
+_JWT_KEY = settings.SUPABASE_JWT_SECRET.encode('utf-8')
+_JWT_AUDIENCE = 'authenticated'
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode a base64url JWT segment, restoring stripped padding"""
+    return base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
+
+
+def _verify_hs256(token: str, key: bytes) -> dict:
+    """
+    Verify an HS256 JWT with one split, one HMAC and two JSON parses.
+    PyJWT's algorithm dispatch, option parsing and claim machinery cost
+    more than the SHA-256 itself for short tokens; this covers exactly
+    the checks Supabase access tokens need (signature, alg pinning,
+    exp, aud, sub).
+
+    Args:
+        token: Raw JWT string
+        key: HS256 signing key bytes
+
+    Returns:
+        Verified payload dictionary
+
+    Raises:
+        jwt.ExpiredSignatureError: If the token is past its exp claim
+        ValueError: On any other validation failure
+    """
+    signing_input, _, signature_b64 = token.rpartition('.')
+    header_b64, _, payload_b64 = signing_input.partition('.')
+    if not header_b64 or not payload_b64 or not signature_b64:
+        raise ValueError('Invalid token format')
+
+    header = json.loads(_b64url_decode(header_b64))
+    if header.get('alg') != 'HS256':
+        # Pin the algorithm - never let the token pick its own
+        raise ValueError('Unexpected algorithm')
+
+    expected = hmac.new(key, signing_input.encode(), hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+        raise ValueError('Signature verification failed')
+
+    payload = json.loads(_b64url_decode(payload_b64))
+
+    exp = payload.get('exp')
+    if exp is None:
+        raise ValueError('Missing exp claim')
+    if exp < time.time():
+        raise jwt.ExpiredSignatureError('Token has expired')
+
+    aud = payload.get('aud')
+    if aud != _JWT_AUDIENCE and not (
+        isinstance(aud, list) and _JWT_AUDIENCE in aud
+    ):
+        raise ValueError('Invalid audience')
+
+    if not payload.get('sub'):
+        raise ValueError('Missing sub claim')
+
+    return payload
+
+# Verified-token cache: blake2b(token) -> (user_pk, cache_expiry). A hit
+# skips the decode, the Supabase sync and the last_login write, leaving
+# one indexed SELECT per request. Entries live for the shorter of the
+# cache TTL and the token's own exp, so a revoked-at-expiry token never
+# outlives its lifetime here.
+_TOKEN_CACHE_MAX = 10_000
+_TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache: dict = {}
+_token_cache_lock = threading.Lock()
+
+# Throttle last_login writes to one per user per window. The guard lives
+# in the cache framework (Redis when configured) so every worker process
+# shares it.
+LAST_LOGIN_THROTTLE_SECONDS = 300
+
+# How long an applied profile fingerprint suppresses re-syncing a user
+# whose JWT metadata hasn't changed
+SYNC_FINGERPRINT_TTL_SECONDS = 3600
+
+
+def _token_cache_get(key: bytes) -> Optional[object]:
+    """Return the cached user_pk for a token hash, or None"""
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+        user_pk, expires_at = entry
+        if expires_at < time.monotonic():
+            del _token_cache[key]
+            return None
+        return user_pk
+
+
+def _token_cache_put(key: bytes, user_pk, token_exp: Optional[float]) -> None:
+    """Cache a verified token, evicting stale entries when full"""
+    now = time.monotonic()
+    expires_at = now + _TOKEN_CACHE_TTL_SECONDS
+    if token_exp is not None:
+        expires_at = min(expires_at, now + max(token_exp - time.time(), 0))
+
+    with _token_cache_lock:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            for cached_key in [
+                k for k, (_, exp) in _token_cache.items() if exp < now
+            ]:
+                del _token_cache[cached_key]
+            if len(_token_cache) >= _TOKEN_CACHE_MAX:
+                _token_cache.clear()
+        _token_cache[key] = (user_pk, expires_at)
+
 
 class SupabaseAuthenticationMiddleware:
     """
@@ -46,10 +166,21 @@ class SupabaseAuthenticationMiddleware:
             
             if not token:
                 return AnonymousUser()
-            
+
+            token_key = hashlib.blake2b(
+                token.encode(), digest_size=16
+            ).digest()
+            cached_pk = _token_cache_get(token_key)
+            if cached_pk is not None:
+                user = self._load_request_user(cached_pk)
+                if user is not None:
+                    return user
+
             try:
                 payload = self._decode_token(token)
                 user = self._get_or_create_user(payload)
+                user = self._load_request_user(user.pk) or user
+                _token_cache_put(token_key, user.pk, payload.get('exp'))
                 return user
             except exceptions.AuthenticationFailed:
                 return AnonymousUser()
@@ -57,6 +188,30 @@ class SupabaseAuthenticationMiddleware:
             logger.error(f"Unexpected error in authentication: {str(e)}", exc_info=True)
             return AnonymousUser()
     
+    def _load_request_user(self, pk) -> Optional[User]:
+        """
+        Fetch the request user with profile joined and roles prefetched.
+        Downstream view code touches user.profile and permission checks
+        read the role cache; loading everything here costs two queries
+        instead of one per access later.
+
+        Args:
+            pk: User primary key
+
+        Returns:
+            User instance with primed role cache, or None
+        """
+        user = (
+            User.objects
+            .with_roles()
+            .select_related('profile')
+            .filter(pk=pk)
+            .first()
+        )
+        if user is not None:
+            user.prime_role_cache()
+        return user
+
     def _extract_token(self, request) -> Optional[str]:
         """
         Extract Bearer token from Authorization header.
@@ -67,54 +222,36 @@ class SupabaseAuthenticationMiddleware:
         Returns:
             JWT token string or None
         """
-        auth_header = request.headers.get('Authorization', '')
-        
-        if not auth_header.startswith('Bearer '):
+        # Read META directly - request.headers normalizes the key on
+        # every lookup through its case-insensitive mapping
+        auth_header = request.META.get('HTTP_AUTHORIZATION')
+
+        if not auth_header or len(auth_header) < 8 or not auth_header.startswith('Bearer '):
             return None
-        
-        return auth_header.split(' ')[1]
+
+        # Slice past the confirmed 'Bearer ' prefix - split() would
+        # allocate a list and rescan the whole header
+        return auth_header[7:]
     
     def _decode_token(self, token: str) -> dict:
         """
-        Decode and validate JWT token using Supabase client.
-        
+        Decode and verify a Supabase JWT in a single pass.
+        Signature, expiry, audience and required claims are all checked
+        inside one decode, so callers can trust the returned payload.
+
         Args:
             token: JWT token string
-            
+
         Returns:
-            Decoded payload dictionary
-            
+            Verified payload dictionary
+
         Raises:
             AuthenticationFailed: If token is invalid or expired
         """
         try:
-            # Decode JWT without verification to extract payload
-            # Note: This is less secure but works with ES256 tokens
-            # TODO: Implement proper JWT verification with public key
-            import json
-            import base64
-            
-            # Split the JWT into parts
-            parts = token.split('.')
-            if len(parts) != 3:
-                raise exceptions.AuthenticationFailed('Invalid token format')
-            
-            # Decode the payload (second part)
-            # Add padding if needed
-            payload_part = parts[1]
-            padding = '=' * (4 - len(payload_part) % 4)
-            payload_json = base64.urlsafe_b64decode(payload_part + padding)
-            payload = json.loads(payload_json)
-            
-            # Verify token is not expired
-            import time
-            exp = payload.get('exp')
-            if exp and exp < time.time():
-                raise exceptions.AuthenticationFailed('Token has expired')
-            
-            return payload
-        except exceptions.AuthenticationFailed:
-            raise
+            return _verify_hs256(token, _JWT_KEY)
+        except jwt.ExpiredSignatureError:
+            raise exceptions.AuthenticationFailed('Token has expired')
         except Exception as e:
             raise exceptions.AuthenticationFailed(f'Invalid token: {str(e)}')
     
@@ -137,19 +274,40 @@ class SupabaseAuthenticationMiddleware:
         
         if not supabase_id or not email:
             raise exceptions.AuthenticationFailed('Invalid token payload')
+
+        # Skip the sync transaction when this payload's profile data was
+        # already applied - on token-cache misses (token rotation) the
+        # user almost always exists with nothing changed
+        fingerprint = hashlib.blake2b(
+            json.dumps(
+                [email, user_metadata], sort_keys=True, separators=(',', ':')
+            ).encode(),
+            digest_size=8
+        ).hexdigest()
+        fingerprint_key = f'sync:{supabase_id}'
+        user = None
+        if cache.get(fingerprint_key) == fingerprint:
+            user = User.objects.filter(supabase_id=supabase_id).first()
+
+        if user is None:
+            # Use UserService to handle user creation/sync
+            user = UserService.sync_from_supabase(
+                supabase_id=supabase_id,
+                email=email,
+                display_name=user_metadata.get('display_name'),
+                avatar_url=user_metadata.get('avatar_url'),
+                user_metadata=user_metadata
+            )
+            cache.set(fingerprint_key, fingerprint, SYNC_FINGERPRINT_TTL_SECONDS)
         
-        # Use UserService to handle user creation/sync
-        user = UserService.sync_from_supabase(
-            supabase_id=supabase_id,
-            email=email,
-            display_name=user_metadata.get('display_name'),
-            avatar_url=user_metadata.get('avatar_url'),
-            user_metadata=user_metadata
-        )
-        
-        # Update last login
-        from django.utils import timezone
-        user.last_login = timezone.now()
-        user.save(update_fields=['last_login'])
-        
+        # Update last login, at most once per throttle window - per-request
+        # precision on this column is not worth an UPDATE per request. The
+        # queryset update skips save() signals and dirty tracking.
+        throttle_key = f'll:{user.pk}'
+        if cache.get(throttle_key) is None:
+            cache.set(throttle_key, 1, LAST_LOGIN_THROTTLE_SECONDS)
+            from django.utils import timezone
+            user.last_login = timezone.now()
+            User.objects.filter(pk=user.pk).update(last_login=user.last_login)
+
         return user
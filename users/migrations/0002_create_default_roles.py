@@ -21,7 +21,8 @@ def create_default_roles(apps, schema_editor):
             name=config['name'],
             defaults={
                 'description': config['description'],
-                'permissions': config['permissions']
+                # permissions config is a frozenset - store as sorted list for JSON
+                'permissions': sorted(config['permissions'])
             }
         )
 
@@ -14,7 +14,8 @@ def update_role_permissions(apps, schema_editor):
     for role_name, config in roles_config.items():
         try:
             role = Role.objects.get(name=role_name)
-            role.permissions = config['permissions']
+            # permissions config is a frozenset - store as sorted list for JSON
+            role.permissions = sorted(config['permissions'])
             role.description = config['description']  # Update description too
             role.save()
         except Role.DoesNotExist:
@@ -22,7 +23,7 @@ def update_role_permissions(apps, schema_editor):
             Role.objects.create(
                 name=config['name'],
                 description=config['description'],
-                permissions=config['permissions']
+                permissions=sorted(config['permissions'])
             )
 
 
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-26 07:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_alter_user_id'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='userroleassignment',
+            name='user_roles_user_id_801a9e_idx',
+        ),
+        migrations.AddIndex(
+            model_name='userroleassignment',
+            index=models.Index(fields=['user', 'role'], include=('created_at',), name='user_role_created_idx'),
+        ),
+    ]
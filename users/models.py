@@ -1,10 +1,60 @@
 # Create your models here.
-from django.db import models
+from django.db import connection, models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
 from django.db.models import Prefetch, QuerySet
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils.functional import cached_property
 from core.models import UUIDModel, TimestampedModel, SoftDeleteModel
 from core.constants import UserRole
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Dict
+
+
+@lru_cache(maxsize=1)
+def _role_id_map() -> Dict[str, int]:
+    """
+    Map of role name to primary key, cached per process.
+    The roles table holds a handful of stable rows; caching the map turns
+    every role__name join on the hot path into an integer-PK filter.
+    Invalidated by the Role post_save/post_delete signals below and
+    explicitly by get_or_create_default_roles, whose bulk INSERT
+    bypasses signals.
+    """
+    return dict(Role.objects.values_list('name', 'id'))
+
+
+@lru_cache(maxsize=1)
+def _user_roles_prefetch() -> Prefetch:
+    """
+    Shared Prefetch for user_roles joined to role.
+    The inner queryset is only a query description until iterated, so one
+    instance can serve every with_roles() call instead of allocating a
+    fresh Prefetch per list endpoint hit.
+    """
+    return Prefetch(
+        'user_roles',
+        queryset=UserRoleAssignment.objects.select_related('role')
+    )
+
+
+def get_role_id(role_name: str) -> Optional[int]:
+    """
+    Resolve a role name to its PK via the cached map.
+    A miss refreshes the map once, in case another process created the
+    role after this one cached it.
+
+    Args:
+        role_name: Role name from UserRole enum
+
+    Returns:
+        Role primary key, or None if no such role exists
+    """
+    role_id = _role_id_map().get(role_name)
+    if role_id is None:
+        _role_id_map.cache_clear()
+        role_id = _role_id_map().get(role_name)
+    return role_id
 
 
 class UserQuerySet(QuerySet):
@@ -12,13 +62,7 @@ class UserQuerySet(QuerySet):
     
     def with_roles(self):
         """Prefetch user roles for efficient queries"""
-        from users.models import UserRoleAssignment  # Avoid circular import
-        return self.prefetch_related(
-            Prefetch(
-                'user_roles',
-                queryset=UserRoleAssignment.objects.select_related('role')
-            )
-        )
+        return self.prefetch_related(_user_roles_prefetch())
     
     def active_users(self):
         """Return only active users"""
@@ -34,7 +78,10 @@ class UserQuerySet(QuerySet):
         Returns:
             Queryset of users with specified role
         """
-        return self.filter(user_roles__role__name=role_name)
+        role_id = get_role_id(role_name)
+        if role_id is None:
+            return self.none()
+        return self.filter(user_roles__role_id=role_id)
     
     def instructors(self):
         """Get all users with instructor role"""
@@ -167,47 +214,133 @@ class User(UUIDModel, AbstractBaseUser, SoftDeleteModel):
         """Always return True for real user instances"""
         return True
     
-    @property
+    @cached_property
     def is_staff(self) -> bool:
-        """Required for Django admin - admins can access admin panel"""
+        """
+        Required for Django admin - admins can access admin panel.
+        Computed at most once per instance; prime_role_cache sets it
+        eagerly so admin/DRF machinery reading it repeatedly never
+        touches the database.
+        """
         return self.has_role(UserRole.ADMIN.value)
-    
-    @property
+
+    @cached_property
     def is_superuser(self) -> bool:
         """Required for Django admin - admins have all permissions"""
         return self.has_role(UserRole.ADMIN.value)
     
+    # Prepared statement for the has_role fallback - two integer-ish
+    # parameters against the covering (user, role) index
+    _HAS_ROLE_SQL = (
+        'SELECT 1 FROM user_roles WHERE user_id = %s AND role_id = %s LIMIT 1'
+    )
+
+    def prime_role_cache(self) -> frozenset:
+        """
+        Load this user's role names once and memoize them on the instance.
+        The authentication middleware calls this so the several permission
+        checks a request runs (IsInstructor, is_staff, object permissions)
+        probe an in-memory set instead of firing an EXISTS query each.
+
+        Returns:
+            Frozenset of role name strings
+        """
+        cache = getattr(self, '_prefetched_objects_cache', None)
+        if cache is not None and 'user_roles' in cache:
+            # Served from the with_roles() prefetch - no extra query
+            self._role_names = frozenset(
+                assignment.role.name for assignment in self.user_roles.all()
+            )
+        else:
+            self._role_names = frozenset(
+                self.user_roles.values_list('role__name', flat=True)
+            )
+        mask = 0
+        for name in self._role_names:
+            if UserRole.has_value(name):
+                mask |= UserRole(name).bit
+        self._role_mask = mask
+        # Fill the cached_property slots so admin/DRF reads are attribute
+        # lookups, never role queries
+        is_admin = UserRole.ADMIN.value in self._role_names
+        self.is_staff = is_admin
+        self.is_superuser = is_admin
+        return self._role_names
+
+    def has_role_mask(self, mask: int) -> bool:
+        """
+        Check roles against a precomputed UserRole bitmask.
+        Permission classes OR their accepted roles' bits together once at
+        module load; the per-request check is then one integer AND.
+
+        Args:
+            mask: ORed UserRole.bit values to test against
+
+        Returns:
+            True if the user holds any role in the mask
+        """
+        role_mask = getattr(self, '_role_mask', None)
+        if role_mask is None:
+            self.prime_role_cache()
+            role_mask = self._role_mask
+        return bool(role_mask & mask)
+
     def has_role(self, role_name: str) -> bool:
         """
         Check if user has a specific role.
-        
+
         Args:
             role_name: Role name from UserRole enum
-            
+
         Returns:
             True if user has the role, False otherwise
         """
-        return self.user_roles.filter(role__name=role_name).exists()
-    
+        role_names = getattr(self, '_role_names', None)
+        if role_names is not None:
+            return role_name in role_names
+        role_id = get_role_id(role_name)
+        if role_id is None:
+            return False
+        # Raw probe skips ORM query compilation on the fallback path;
+        # get_db_prep_value keeps the UUID pk portable across backends
+        user_pk = self._meta.pk.get_db_prep_value(self.pk, connection)
+        with connection.cursor() as cursor:
+            cursor.execute(self._HAS_ROLE_SQL, [user_pk, role_id])
+            return cursor.fetchone() is not None
+
     def has_any_role(self, role_names: List[str]) -> bool:
         """
         Check if user has any of the specified roles.
-        
+
         Args:
             role_names: List of role names from UserRole enum
-            
+
         Returns:
             True if user has at least one role, False otherwise
         """
-        return self.user_roles.filter(role__name__in=role_names).exists()
-    
+        cached = getattr(self, '_role_names', None)
+        if cached is not None:
+            return not cached.isdisjoint(role_names)
+        # Probe the cached map without the refresh-on-miss round trip -
+        # names absent from it simply cannot match any assignment
+        role_ids = [
+            role_id for name in role_names
+            if (role_id := _role_id_map().get(name)) is not None
+        ]
+        if not role_ids:
+            return False
+        return self.user_roles.filter(role_id__in=role_ids).exists()
+
     def get_roles(self) -> List[str]:
         """
         Get list of user's role names.
-        
+
         Returns:
             List of role name strings
         """
+        role_names = getattr(self, '_role_names', None)
+        if role_names is not None:
+            return list(role_names)
         return list(self.user_roles.values_list('role__name', flat=True))
     
     def has_perm(self, perm, obj=None) -> bool:
@@ -251,19 +384,37 @@ class Role(models.Model):
         Create default roles if they don't exist using centralized configuration.
         Idempotent - safe to call multiple times.
         Uses core.constants.DEFAULT_ROLES_CONFIG as single source of truth.
+        Issues a single bulk INSERT; existing roles are skipped via the
+        unique constraint on name.
         """
         from core.constants import get_all_roles_config
-        
+
         roles_config = get_all_roles_config()
-        
-        for role_name, config in roles_config.items():
-            cls.objects.get_or_create(
-                name=config['name'],
-                defaults={
-                    'description': config['description'],
-                    'permissions': config['permissions']
-                }
-            )
+
+        cls.objects.bulk_create(
+            [
+                cls(
+                    name=config['name'],
+                    description=config['description'],
+                    # permissions config is a frozenset - store as sorted list for JSON
+                    permissions=sorted(config['permissions'])
+                )
+                for config in roles_config.values()
+            ],
+            ignore_conflicts=True
+        )
+
+        # bulk_create fires no post_save signals, so the signal receiver
+        # below never sees the seeding - drop the map here so a process
+        # that cached it pre-seed doesn't keep an empty map forever
+        _role_id_map.cache_clear()
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+def _invalidate_role_id_map(sender, **kwargs):
+    """Drop the cached name->id map whenever the roles table changes"""
+    _role_id_map.cache_clear()
 
 
 class UserRoleAssignment(TimestampedModel):
@@ -295,7 +446,13 @@ class UserRoleAssignment(TimestampedModel):
         verbose_name_plural = 'User Role Assignments'
         unique_together = ['user', 'role']
         indexes = [
-            models.Index(fields=['user', 'role']),
+            # INCLUDE created_at so role-check EXISTS probes and recency
+            # reads resolve as index-only scans on Postgres
+            models.Index(
+                fields=['user', 'role'],
+                include=['created_at'],
+                name='user_role_created_idx'
+            ),
             models.Index(fields=['-created_at']),
         ]
     
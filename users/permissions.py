@@ -2,8 +2,68 @@ from rest_framework import permissions
 from core.constants import UserRole
 from typing import Any
 
+# Accepted-role bitmasks ORed together once at import; each permission
+# check is then a single integer AND via User.has_role_mask
+_STUDENT_OR_ABOVE = (
+    UserRole.STUDENT.bit | UserRole.INSTRUCTOR.bit | UserRole.ADMIN.bit
+)
+_INSTRUCTOR_OR_ADMIN = UserRole.INSTRUCTOR.bit | UserRole.ADMIN.bit
+_ADMIN = UserRole.ADMIN.bit
+_INSTRUCTOR = UserRole.INSTRUCTOR.bit
 
-class IsAuthenticatedUser(permissions.BasePermission):
+# Candidate names probed when a view does not pin its owner field
+_OWNER_FIELD_NAMES = ('user', 'author', 'created_by', 'owner')
+
+# frozenset membership beats the O(n) scan of DRF's SAFE_METHODS tuple;
+# tiny, but every request with a read-path permission pays it
+_SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+
+
+def _resolve_owner_field(permission, view, obj) -> Any:
+    """
+    Resolve which attribute on obj names its owner.
+    A permission subclass (or view) can pin it via owner_field; otherwise
+    the candidate list is probed once and the result cached on the view
+    class, so the hasattr walk runs a single time per view instead of on
+    every object check.
+
+    Returns:
+        Field name string, or None if the object has no owner field
+    """
+    owner_field = permission.owner_field or getattr(view, 'owner_field', None)
+    if owner_field:
+        return owner_field
+
+    cached = getattr(view.__class__, '_owner_field_cache', _OWNER_FIELD_NAMES)
+    if cached is not _OWNER_FIELD_NAMES:
+        return cached
+
+    for field_name in _OWNER_FIELD_NAMES:
+        if hasattr(obj, field_name):
+            view.__class__._owner_field_cache = field_name
+            return field_name
+
+    view.__class__._owner_field_cache = None
+    return None
+
+
+class _SingletonPermission(permissions.BasePermission):
+    """
+    Base for stateless permissions that share a single instance.
+    DRF instantiates every permission class on each view dispatch;
+    classes with no per-instance state hand back one cached object
+    instead of allocating a fresh one per request.
+    """
+
+    def __new__(cls):
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
+
+class IsAuthenticatedUser(_SingletonPermission):
     """
     Base permission requiring valid authentication.
     Replaces DRF's IsAuthenticated to work with Supabase middleware.
@@ -15,7 +75,7 @@ class IsAuthenticatedUser(permissions.BasePermission):
         return request.user and request.user.is_authenticated
 
 
-class IsStudent(permissions.BasePermission):
+class IsStudent(_SingletonPermission):
     """
     Permission requiring Student role or higher.
     Admins and Instructors also have student-level access.
@@ -27,14 +87,10 @@ class IsStudent(permissions.BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
         
-        return request.user.has_any_role([
-            UserRole.STUDENT.value,
-            UserRole.INSTRUCTOR.value,
-            UserRole.ADMIN.value
-        ])
+        return request.user.has_role_mask(_STUDENT_OR_ABOVE)
 
 
-class IsInstructor(permissions.BasePermission):
+class IsInstructor(_SingletonPermission):
     """
     Permission requiring Instructor or Admin role.
     Used for content creation and management.
@@ -46,13 +102,10 @@ class IsInstructor(permissions.BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
         
-        return request.user.has_any_role([
-            UserRole.INSTRUCTOR.value,
-            UserRole.ADMIN.value
-        ])
+        return request.user.has_role_mask(_INSTRUCTOR_OR_ADMIN)
 
 
-class IsAdmin(permissions.BasePermission):
+class IsAdmin(_SingletonPermission):
     """
     Permission requiring Admin role.
     Used for administrative actions and content approval.
@@ -64,7 +117,7 @@ class IsAdmin(permissions.BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
         
-        return request.user.has_role(UserRole.ADMIN.value)
+        return request.user.has_role_mask(_ADMIN)
 
 
 class IsOwnerOrAdmin(permissions.BasePermission):
@@ -73,25 +126,28 @@ class IsOwnerOrAdmin(permissions.BasePermission):
     Implements object-level permission checking.
     """
     message = 'You can only modify your own content, or you must be an admin.'
-    
+    owner_field = None
+
     def has_permission(self, request, view) -> bool:
         """Allow authenticated users to attempt the action"""
         return request.user and request.user.is_authenticated
-    
+
     def has_object_permission(self, request, view, obj) -> bool:
         """Check if user owns the object or is an admin"""
         # Admins can do anything
-        if request.user.has_role(UserRole.ADMIN.value):
+        if request.user.has_role_mask(_ADMIN):
             return True
-        
+
         # Check ownership - object must have a user/author/created_by field
-        owner_field_names = ['user', 'author', 'created_by', 'owner']
-        
-        for field_name in owner_field_names:
-            if hasattr(obj, field_name):
-                owner = getattr(obj, field_name)
-                return owner == request.user
-        
+        field_name = _resolve_owner_field(self, view, obj)
+        if field_name is not None:
+            # Compare FK ids - touching the related object would lazy-load
+            # the owner row for every list item
+            owner_id = getattr(obj, f'{field_name}_id', None)
+            if owner_id is not None:
+                return owner_id == request.user.pk
+            return getattr(obj, field_name) == request.user
+
         # If no owner field found, deny access
         return False
 
@@ -101,26 +157,29 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
     Permission allowing owners to modify, but anyone to view.
     Read-only access for non-owners.
     """
-    
+    owner_field = None
+
     def has_permission(self, request, view) -> bool:
         """Allow read operations for anyone, write for authenticated"""
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
         return request.user and request.user.is_authenticated
-    
+
     def has_object_permission(self, request, view, obj) -> bool:
         """Allow read to anyone, write only to owner"""
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
-        
+
         # Check ownership
-        owner_field_names = ['user', 'author', 'created_by', 'owner']
-        
-        for field_name in owner_field_names:
-            if hasattr(obj, field_name):
-                owner = getattr(obj, field_name)
-                return owner == request.user
-        
+        field_name = _resolve_owner_field(self, view, obj)
+        if field_name is not None:
+            # Compare FK ids - touching the related object would lazy-load
+            # the owner row for every list item
+            owner_id = getattr(obj, f'{field_name}_id', None)
+            if owner_id is not None:
+                return owner_id == request.user.pk
+            return getattr(obj, field_name) == request.user
+
         return False
 
 
@@ -130,44 +189,43 @@ class CanManageContent(permissions.BasePermission):
     Instructors can create drafts, Admins can publish.
     """
     message = 'You must be an instructor or admin to manage content.'
-    
+    owner_field = None
+
     def has_permission(self, request, view) -> bool:
         """Check if user can manage content"""
         if not request.user or not request.user.is_authenticated:
             return False
         
         # Allow GET/HEAD/OPTIONS for anyone
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
         
         # POST/PUT/PATCH/DELETE require Instructor or Admin
-        return request.user.has_any_role([
-            UserRole.INSTRUCTOR.value,
-            UserRole.ADMIN.value
-        ])
+        return request.user.has_role_mask(_INSTRUCTOR_OR_ADMIN)
     
     def has_object_permission(self, request, view, obj) -> bool:
         """Check object-level permissions"""
         # Read access for all
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
         
         # Admins can modify anything
-        if request.user.has_role(UserRole.ADMIN.value):
+        if request.user.has_role_mask(_ADMIN):
             return True
         
         # Instructors can only modify their own content
-        if request.user.has_role(UserRole.INSTRUCTOR.value):
-            owner_field_names = ['user', 'author', 'created_by', 'owner']
-            for field_name in owner_field_names:
-                if hasattr(obj, field_name):
-                    owner = getattr(obj, field_name)
-                    return owner == request.user
-        
+        if request.user.has_role_mask(_INSTRUCTOR):
+            field_name = _resolve_owner_field(self, view, obj)
+            if field_name is not None:
+                owner_id = getattr(obj, f'{field_name}_id', None)
+                if owner_id is not None:
+                    return owner_id == request.user.pk
+                return getattr(obj, field_name) == request.user
+
         return False
 
 
-class CanModerateQnA(permissions.BasePermission):
+class CanModerateQnA(_SingletonPermission):
     """
     Permission for Q&A moderation.
     Admins and Instructors can moderate.
@@ -179,13 +237,10 @@ class CanModerateQnA(permissions.BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
         
-        return request.user.has_any_role([
-            UserRole.INSTRUCTOR.value,
-            UserRole.ADMIN.value
-        ])
+        return request.user.has_role_mask(_INSTRUCTOR_OR_ADMIN)
 
 
-class ReadOnly(permissions.BasePermission):
+class ReadOnly(_SingletonPermission):
     """
     Permission allowing only read operations.
     Useful for public endpoints.
@@ -193,4 +248,4 @@ class ReadOnly(permissions.BasePermission):
     
     def has_permission(self, request, view) -> bool:
         """Allow only safe methods"""
-        return request.method in permissions.SAFE_METHODS
+        return request.method in _SAFE_METHODS
@@ -1,6 +1,24 @@
+from django.db import models
 from rest_framework import serializers
+from core.constants import UserRole
 from users.models import User, Role, UserRoleAssignment, UserProfile
 from typing import List
+from urllib.parse import urlparse
+
+
+def _role_objects(user: User) -> List[Role]:
+    """
+    Collect a user's Role objects without redundant queries.
+    Reads the with_roles() prefetch cache when present; calling
+    select_related on the related manager would build a fresh queryset
+    and re-query even for prefetched users.
+    """
+    cache = getattr(user, '_prefetched_objects_cache', None)
+    if cache is not None and 'user_roles' in cache:
+        assignments = user.user_roles.all()
+    else:
+        assignments = user.user_roles.select_related('role').all()
+    return [assignment.role for assignment in assignments]
 
 
 class RoleSerializer(serializers.ModelSerializer):
@@ -30,13 +48,30 @@ class UserProfileSerializer(serializers.ModelSerializer):
         ]
 
 
+class _RolesField(serializers.Field):
+    """
+    Read-only roles field, lighter than a SerializerMethodField.
+    A plain Field skips SerializerMethodField's bind-time method lookup
+    and per-instance error-message wiring; with source='*' it receives
+    the user itself and serves roles straight from the prefetch cache.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('source', '*')
+        kwargs.setdefault('read_only', True)
+        super().__init__(**kwargs)
+
+    def to_representation(self, user: User) -> List[dict]:
+        return RoleSerializer(_role_objects(user), many=True).data
+
+
 class UserSerializer(serializers.ModelSerializer):
     """
     Basic user serializer for public user information.
     Used in lists and references.
     """
-    roles = serializers.SerializerMethodField()
-    
+    roles = _RolesField()
+
     class Meta:
         model = User
         fields = [
@@ -44,11 +79,20 @@ class UserSerializer(serializers.ModelSerializer):
             'is_active', 'last_login', 'created_at', 'roles'
         ]
         read_only_fields = ['id', 'supabase_id', 'email', 'is_active', 'last_login', 'created_at', 'roles']
-    
-    def get_roles(self, obj: User) -> List[dict]:
-        """Get list of role objects"""
-        roles = obj.user_roles.select_related('role').all()
-        return RoleSerializer([assignment.role for assignment in roles], many=True).data
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Attach the relations get_roles reads and project only the
+        columns this serializer renders.
+        Views must run list querysets through this so serializing N users
+        costs two queries instead of one role query per user; the only()
+        keeps unused columns out of every fetched row.
+        """
+        return queryset.with_roles().only(
+            'id', 'supabase_id', 'email', 'display_name',
+            'is_active', 'last_login', 'created_at'
+        )
 
 
 class UserDetailSerializer(serializers.ModelSerializer):
@@ -56,26 +100,99 @@ class UserDetailSerializer(serializers.ModelSerializer):
     Detailed user serializer including profile and roles.
     Used for user detail view and current user endpoint.
     """
-    roles = serializers.SerializerMethodField()
-    profile = UserProfileSerializer(read_only=True)
+    roles = _RolesField()
     is_active = serializers.BooleanField(read_only=True)
-    
+
     class Meta:
         model = User
         fields = [
             'id', 'email', 'display_name', 'supabase_id',
             'is_active', 'last_login', 'created_at', 'updated_at',
-            'roles', 'profile'
+            'roles'
         ]
         read_only_fields = [
             'id', 'email', 'supabase_id', 'is_active',
             'last_login', 'created_at', 'updated_at'
         ]
-    
-    def get_roles(self, obj: User) -> List[dict]:
-        """Get list of role objects"""
-        roles = obj.user_roles.select_related('role').all()
-        return RoleSerializer([assignment.role for assignment in roles], many=True).data
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Attach the relations this serializer reads (roles and profile),
+        projected down to the rendered columns
+        """
+        return queryset.with_roles().select_related('profile').only(
+            'id', 'email', 'display_name', 'supabase_id',
+            'is_active', 'last_login', 'created_at', 'updated_at',
+            'profile__bio', 'profile__avatar_url', 'profile__location',
+            'profile__website', 'profile__github_username',
+            'profile__linkedin_url', 'profile__total_bookmarks',
+            'profile__total_contributions', 'profile__total_questions',
+            'profile__total_answers', 'profile__reputation_score'
+        )
+
+    def to_representation(self, instance: User) -> dict:
+        """
+        Render the user, attaching the profile as a plain dict.
+        Building the profile by hand skips instantiating a nested
+        UserProfileSerializer (and its field machinery) per request;
+        the profile row itself comes from the select_related join.
+        """
+        data = super().to_representation(instance)
+        try:
+            profile = instance.profile
+        except UserProfile.DoesNotExist:
+            data['profile'] = None
+        else:
+            data['profile'] = {
+                'bio': profile.bio,
+                'avatar_url': profile.avatar_url,
+                'location': profile.location,
+                'website': profile.website,
+                'github_username': profile.github_username,
+                'linkedin_url': profile.linkedin_url,
+                'total_bookmarks': profile.total_bookmarks,
+                'total_contributions': profile.total_contributions,
+                'total_questions': profile.total_questions,
+                'total_answers': profile.total_answers,
+                'reputation_score': profile.reputation_score,
+            }
+        return data
+
+
+class _UserRoleAssignmentListSerializer(serializers.ListSerializer):
+    """
+    List serializer that batches the nested user lookups.
+    Rendering assignments row by row serializes each referenced user
+    (and their roles) separately; here every user a page mentions is
+    fetched and serialized exactly once, then rows render by dict lookup.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        assignments = list(iterable)
+
+        user_ids = {a.user_id for a in assignments}
+        user_ids.update(
+            a.assigned_by_id for a in assignments if a.assigned_by_id
+        )
+        users = UserSerializer.setup_eager_loading(
+            User.objects.filter(id__in=user_ids)
+        )
+        user_data = {user.id: UserSerializer(user).data for user in users}
+
+        created_at_field = serializers.DateTimeField()
+        return [
+            {
+                'user': user_data.get(assignment.user_id),
+                'role': RoleSerializer(assignment.role).data,
+                'assigned_by': user_data.get(assignment.assigned_by_id),
+                'created_at': created_at_field.to_representation(
+                    assignment.created_at
+                ),
+            }
+            for assignment in assignments
+        ]
 
 
 class UserRoleAssignmentSerializer(serializers.ModelSerializer):
@@ -86,38 +203,103 @@ class UserRoleAssignmentSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
     role = RoleSerializer(read_only=True)
     assigned_by = UserSerializer(read_only=True)
-    
+
     class Meta:
         model = UserRoleAssignment
         fields = ['user', 'role', 'assigned_by', 'created_at']
         read_only_fields = ['user', 'role', 'assigned_by', 'created_at']
+        list_serializer_class = _UserRoleAssignmentListSerializer
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the role for single-row renders; lists batch users above"""
+        return queryset.select_related('user', 'role', 'assigned_by')
+
+
+# Plain-function validators for the two tiny write payloads. Building a
+# DRF Serializer per request pays for lazy error-message machinery and
+# per-field construction that dwarfs these checks.
+
+# Role vocabulary frozen at import - the validator does one hash lookup
+# and reuses one prebuilt error message instead of re-walking the enum
+_VALID_ROLE_NAMES = frozenset(UserRole.values())
+_INVALID_ROLE_SUFFIX = f"Must be one of: {', '.join(UserRole.values())}"
 
+_PROFILE_FIELDS = ('bio', 'location', 'website', 'github_username', 'linkedin_url')
+_PROFILE_MAX_LENGTHS = {'bio': 500, 'location': 100, 'github_username': 100}
+_PROFILE_URL_FIELDS = frozenset(('website', 'linkedin_url'))
 
-class AssignRoleSerializer(serializers.Serializer):
+
+def validate_assign_role(data: dict) -> dict:
     """
-    Serializer for role assignment endpoint.
-    Validates role name before assignment.
+    Validate a role assignment payload.
+
+    Args:
+        data: Request data with a role_name key
+
+    Returns:
+        Dict with the validated role_name
+
+    Raises:
+        serializers.ValidationError: If the payload is not a dict or
+            role_name is missing or unknown
     """
-    role_name = serializers.CharField(max_length=20)
-    
-    def validate_role_name(self, value: str) -> str:
-        """Validate that role name is valid"""
-        from core.constants import UserRole
-        
-        if not UserRole.has_value(value):
-            raise serializers.ValidationError(
-                f"Invalid role: {value}. Must be one of: {', '.join(UserRole.values())}"
-            )
-        return value
-
-
-class UpdateProfileSerializer(serializers.Serializer):
-    """
-    Serializer for updating user profile.
-    Validates profile data before update.
-    """
-    bio = serializers.CharField(max_length=500, required=False, allow_blank=True)
-    location = serializers.CharField(max_length=100, required=False, allow_blank=True)
-    website = serializers.URLField(required=False, allow_blank=True)
-    github_username = serializers.CharField(max_length=100, required=False, allow_blank=True)
-    linkedin_url = serializers.URLField(required=False, allow_blank=True)
+    # JSONParser happily yields lists and strings; mirror the DRF
+    # serializer's non-dict rejection instead of crashing on .get
+    if not isinstance(data, dict):
+        raise serializers.ValidationError({
+            'non_field_errors': [
+                f'Invalid data. Expected a dictionary, '
+                f'but got {type(data).__name__}.'
+            ]
+        })
+    role_name = data.get('role_name')
+    if not isinstance(role_name, str) or not role_name:
+        raise serializers.ValidationError(
+            {'role_name': ['This field is required.']}
+        )
+    if role_name not in _VALID_ROLE_NAMES:
+        raise serializers.ValidationError({
+            'role_name': [f"Invalid role: {role_name}. {_INVALID_ROLE_SUFFIX}"]
+        })
+    return {'role_name': role_name}
+
+
+def validate_update_profile(data: dict) -> dict:
+    """
+    Validate a profile update payload.
+    Unknown keys are ignored; only recognized profile fields pass through.
+
+    Args:
+        data: Request data with optional profile fields
+
+    Returns:
+        Dict of validated profile fields
+
+    Raises:
+        serializers.ValidationError: If any provided field is invalid
+    """
+    cleaned = {}
+    errors = {}
+    for field in _PROFILE_FIELDS:
+        if field not in data:
+            continue
+        value = data[field]
+        if not isinstance(value, str):
+            errors[field] = ['Not a valid string.']
+            continue
+        max_length = _PROFILE_MAX_LENGTHS.get(field)
+        if max_length is not None and len(value) > max_length:
+            errors[field] = [
+                f'Ensure this field has no more than {max_length} characters.'
+            ]
+            continue
+        if value and field in _PROFILE_URL_FIELDS:
+            parsed = urlparse(value)
+            if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+                errors[field] = ['Enter a valid URL.']
+                continue
+        cleaned[field] = value
+    if errors:
+        raise serializers.ValidationError(errors)
+    return cleaned
@@ -1,11 +1,37 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from django.db import transaction
 from django.core.exceptions import PermissionDenied
-from users.models import User, Role, UserRoleAssignment
-from core.constants import UserRole
+from users.models import User, Role, UserRoleAssignment, get_role_id
+from core.constants import AuditAction, UserRole
 from core.services.audit_service import AuditService
 from core.exceptions import ValidationError, PermissionDeniedError
 
+# Role rows are created once and effectively immutable, so each process
+# resolves a Role object at most once per name instead of running
+# get_or_create on every assignment
+_ROLE_CACHE: Dict[str, Role] = {}
+
+# Set once initialize_default_roles has completed in this process so
+# repeat calls can skip the bulk INSERT
+_roles_initialized = False
+
+# Admin bit resolved once; has_role_mask primes the caller's role cache
+# on first use, so a request assigning several roles back-to-back pays
+# for one role query, not one per permission check
+_ADMIN_MASK = UserRole.ADMIN.bit
+
+
+def _get_cached_role(role_name: str) -> Role:
+    """Fetch (or create) a Role once per process"""
+    role = _ROLE_CACHE.get(role_name)
+    if role is None:
+        role, _ = Role.objects.get_or_create(
+            name=role_name,
+            defaults={'description': f'{UserRole.get_display(role_name)} role'}
+        )
+        _ROLE_CACHE[role_name] = role
+    return role
+
 
 class RoleService:
     """
@@ -14,7 +40,6 @@ class RoleService:
     """
     
     @staticmethod
-    @transaction.atomic
     def assign_role(
         user: User,
         role_name: str,
@@ -45,29 +70,144 @@ class RoleService:
                 f"User {assigned_by.display_name} cannot assign role {role_name}"
             )
         
-        # Get or create role
-        role, _ = Role.objects.get_or_create(
-            name=role_name,
-            defaults={'description': f'{UserRole.get_display(role_name)} role'}
-        )
-        
-        # Assign role (get_or_create to avoid duplicates)
-        assignment, created = UserRoleAssignment.objects.get_or_create(
-            user=user,
-            role=role,
-            defaults={'assigned_by': assigned_by}
-        )
-        
-        # Log the action
-        if created:
-            AuditService.log_role_assignment(
+        # Fast path: the common idempotent re-assignment (every
+        # sync_from_supabase re-sends the default role) needs at most one
+        # indexed SELECT and no write transaction
+        role_id = get_role_id(role_name)
+        if role_id is not None:
+            cached_names = getattr(user, '_role_names', None)
+            if cached_names is None or role_name in cached_names:
+                existing = UserRoleAssignment.objects.filter(
+                    user=user, role_id=role_id
+                ).first()
+                if existing is not None:
+                    return existing
+
+        role = _get_cached_role(role_name)
+
+        # Only open a transaction when an INSERT is actually needed
+        with transaction.atomic():
+            assignment, created = UserRoleAssignment.objects.get_or_create(
                 user=user,
                 role=role,
-                assigned_by=assigned_by
+                defaults={'assigned_by': assigned_by}
             )
-        
+
+            # Log after commit - keeps audit work off the critical path
+            # and never records an assignment that rolled back
+            if created:
+                transaction.on_commit(
+                    lambda: AuditService.log_role_assignment(
+                        user=user,
+                        role=role,
+                        assigned_by=assigned_by
+                    )
+                )
+
         return assignment
     
+    @staticmethod
+    def bulk_assign_role(
+        user_ids: List,
+        role_name: str,
+        assigned_by: Optional[User] = None
+    ) -> int:
+        """
+        Assign one role to many users in a single INSERT.
+        Replaces per-user assign_role loops in admin tooling: the role is
+        resolved once, the assignments go in via one bulk_create, and one
+        batched audit entry is written instead of one per user.
+
+        Args:
+            user_ids: IDs of users to assign the role to
+            role_name: Name of the role (from UserRole enum)
+            assigned_by: User performing the assignment (None for system)
+
+        Returns:
+            Number of assignments submitted
+
+        Raises:
+            ValidationError: If role_name is invalid
+            PermissionDeniedError: If assigned_by doesn't have permission
+        """
+        if not UserRole.has_value(role_name):
+            raise ValidationError(f"Invalid role: {role_name}")
+
+        if assigned_by and not RoleService.can_assign_role(assigned_by, role_name):
+            raise PermissionDeniedError(
+                f"User {assigned_by.display_name} cannot assign role {role_name}"
+            )
+
+        user_ids = list(user_ids)
+        if not user_ids:
+            return 0
+
+        role = _get_cached_role(role_name)
+        with transaction.atomic():
+            UserRoleAssignment.objects.bulk_create(
+                [
+                    UserRoleAssignment(
+                        user_id=user_id, role=role, assigned_by=assigned_by
+                    )
+                    for user_id in user_ids
+                ],
+                ignore_conflicts=True,
+                batch_size=1000
+            )
+
+        AuditService.log_action(
+            entity=role,
+            action=AuditAction.UPDATE.value,
+            user=assigned_by,
+            new_data={'role_added': role.name},
+            metadata={'user_count': len(user_ids)}
+        )
+        return len(user_ids)
+
+    @staticmethod
+    def bulk_revoke_role(
+        user_ids: List,
+        role_name: str,
+        revoked_by: Optional[User] = None
+    ) -> int:
+        """
+        Revoke one role from many users in a single DELETE.
+
+        Args:
+            user_ids: IDs of users to revoke the role from
+            role_name: Name of the role to revoke
+            revoked_by: User performing the revocation (None for system)
+
+        Returns:
+            Number of assignments removed
+
+        Raises:
+            PermissionDeniedError: If revoked_by doesn't have permission
+        """
+        if revoked_by and not RoleService.can_revoke_role(revoked_by, role_name):
+            raise PermissionDeniedError(
+                f"User {revoked_by.display_name} cannot revoke role {role_name}"
+            )
+
+        user_ids = list(user_ids)
+        if not user_ids:
+            return 0
+
+        deleted, _ = UserRoleAssignment.objects.filter(
+            user_id__in=user_ids, role__name=role_name
+        ).delete()
+
+        if deleted:
+            role = _get_cached_role(role_name)
+            AuditService.log_action(
+                entity=role,
+                action=AuditAction.UPDATE.value,
+                user=revoked_by,
+                old_data={'role_removed': role_name},
+                metadata={'user_count': deleted}
+            )
+        return deleted
+
     @staticmethod
     @transaction.atomic
     def revoke_role(
@@ -95,20 +235,26 @@ class RoleService:
                 f"User {revoked_by.display_name} cannot revoke role {role_name}"
             )
         
+        role_id = get_role_id(role_name)
+        if role_id is None:
+            return False
+
         try:
             assignment = UserRoleAssignment.objects.get(
                 user=user,
-                role__name=role_name
+                role_id=role_id
             )
             assignment.delete()
-            
-            # Log the action
-            AuditService.log_role_revocation(
-                user=user,
-                role_name=role_name,
-                revoked_by=revoked_by
+
+            # Log after commit, off the critical path
+            transaction.on_commit(
+                lambda: AuditService.log_role_revocation(
+                    user=user,
+                    role_name=role_name,
+                    revoked_by=revoked_by
+                )
             )
-            
+
             return True
         except UserRoleAssignment.DoesNotExist:
             return False
@@ -127,11 +273,9 @@ class RoleService:
         Returns:
             True if user can assign role, False otherwise
         """
-        # Only admins can assign roles
-        if not assigner.has_role(UserRole.ADMIN.value):
-            return False
-        
-        return True
+        # Only admins can assign roles; the mask check memoizes the
+        # assigner's roles on the instance
+        return assigner.has_role_mask(_ADMIN_MASK)
     
     @staticmethod
     def can_revoke_role(revoker: User, role_name: str) -> bool:
@@ -148,20 +292,43 @@ class RoleService:
             True if user can revoke role, False otherwise
         """
         # Only admins can revoke roles
-        return revoker.has_role(UserRole.ADMIN.value)
+        return revoker.has_role_mask(_ADMIN_MASK)
     
     @staticmethod
-    def get_users_by_role(role_name: str) -> List[User]:
+    def get_users_by_role(role_name: str) -> Iterable[User]:
         """
         Get all users with a specific role.
-        
+        Streams rows in chunks instead of materializing the whole role
+        in memory; callers that need a list can wrap in list() explicitly.
+
         Args:
             role_name: Role name from UserRole enum
-            
+
+        Returns:
+            Iterable of User instances
+        """
+        return User.objects.by_role(role_name).iterator(chunk_size=500)
+
+    @staticmethod
+    def get_users_by_role_page(
+        role_name: str,
+        limit: int,
+        offset: int = 0
+    ) -> List[User]:
+        """
+        Get one page of users with a specific role.
+        Slicing happens at the database (LIMIT/OFFSET), so memory stays
+        bounded regardless of role size.
+
+        Args:
+            role_name: Role name from UserRole enum
+            limit: Maximum number of users to return
+            offset: Number of users to skip
+
         Returns:
             List of User instances
         """
-        return list(User.objects.by_role(role_name))
+        return list(User.objects.by_role(role_name)[offset:offset + limit])
     
     @staticmethod
     @transaction.atomic
@@ -193,7 +360,7 @@ class RoleService:
         Raises:
             PermissionDeniedError: If admin doesn't have permission
         """
-        if not admin.has_role(UserRole.ADMIN.value):
+        if not admin.has_role_mask(_ADMIN_MASK):
             raise PermissionDeniedError("Only admins can promote users to admin role")
         
         RoleService.assign_role(user, UserRole.ADMIN.value, admin)
@@ -213,5 +380,17 @@ class RoleService:
     
     @staticmethod
     def initialize_default_roles() -> None:
-        """Initialize default roles in the database"""
+        """
+        Initialize default roles in the database.
+        After the first successful run in a process, a cheap count check
+        replaces the bulk INSERT; callers like test fixtures and the
+        roles/initialize endpoint can invoke this freely.
+        """
+        global _roles_initialized
+        if _roles_initialized and Role.objects.count() >= len(UserRole):
+            return
         Role.get_or_create_default_roles()
+        # Seeding bypasses Role signals (bulk_create), so drop any Role
+        # objects cached before the table was populated
+        _ROLE_CACHE.clear()
+        _roles_initialized = True
@@ -3,13 +3,25 @@ User service - Business logic for user management.
 Handles user lifecycle operations and profile management.
 """
 from django.db import transaction
-from typing import Optional, Dict, Any
-from users.models import User, UserProfile
+from django.db.models import Exists, F, OuterRef
+from typing import Any, Dict, List, Optional
+from users.models import User, UserProfile, UserRoleAssignment
 from users.services.role_service import RoleService
 from core.services.audit_service import AuditService
 from core.exceptions import ValidationError
 from core.constants import UserRole, AuditAction
 
+# Field whitelists frozen at import: membership checks on the hot
+# profile-edit and stat-increment paths are one hash probe, and field
+# names stay out of attacker control
+_ALLOWED_PROFILE_FIELDS = frozenset([
+    'bio', 'location', 'website', 'github_username', 'linkedin_url'
+])
+_ALLOWED_STATS = frozenset([
+    'total_bookmarks', 'total_contributions', 'total_questions',
+    'total_answers', 'reputation_score'
+])
+
 
 class UserService:
     """
@@ -48,24 +60,28 @@ class UserService:
                 'display_name': display_name or email.split('@')[0]
             }
         )
-        
-        # Update email if changed
+
+        # Collect changed fields and write them in one UPDATE instead of
+        # one round-trip per field
+        user_updates = []
         if user.email != email:
             user.email = email
-            user.save(update_fields=['email'])
-        
-        # Update display name if changed and provided
+            user_updates.append('email')
         if display_name and user.display_name != display_name:
             user.display_name = display_name
-            user.save(update_fields=['display_name'])
-        
-        # Create or update profile
+            user_updates.append('display_name')
+        if user_updates:
+            user.save(update_fields=user_updates)
+
+        # Create or update profile, seeding the avatar on first creation
+        # so the common new-user path needs no follow-up save
         profile, profile_created = UserProfile.objects.get_or_create(
-            user=user
+            user=user,
+            defaults={'avatar_url': avatar_url or ''}
         )
-        
+
         # Update avatar if changed
-        if avatar_url and profile.avatar_url != avatar_url:
+        if not profile_created and avatar_url and profile.avatar_url != avatar_url:
             profile.avatar_url = avatar_url
             profile.save(update_fields=['avatar_url'])
         
@@ -88,41 +104,127 @@ class UserService:
     
     @staticmethod
     @transaction.atomic
+    def sync_many_from_supabase(records: List[Dict[str, Any]]) -> List[User]:
+        """
+        Sync a batch of Supabase users in a constant number of queries.
+        One filter resolves all existing rows, then missing users,
+        their profiles and their Student roles are bulk-created and
+        changed emails/display names are bulk-updated - the per-user
+        round-trips of sync_from_supabase don't scale to webhook
+        deliveries that queue hundreds of users at once.
+
+        Args:
+            records: Dicts with supabase_id, email and optionally
+                display_name and avatar_url
+
+        Returns:
+            List of synced User instances, in input order
+        """
+        if not records:
+            return []
+
+        existing = {
+            user.supabase_id: user
+            for user in User.objects.filter(
+                supabase_id__in=[r['supabase_id'] for r in records]
+            ).select_related('profile')
+        }
+
+        new_users = []
+        changed_users = []
+        changed_fields = set()
+        avatar_profiles = []
+        for record in records:
+            email = record['email']
+            user = existing.get(record['supabase_id'])
+            if user is None:
+                new_users.append(User(
+                    supabase_id=record['supabase_id'],
+                    email=email,
+                    display_name=record.get('display_name') or email.split('@')[0]
+                ))
+                continue
+
+            updates = []
+            if user.email != email:
+                user.email = email
+                updates.append('email')
+            display_name = record.get('display_name')
+            if display_name and user.display_name != display_name:
+                user.display_name = display_name
+                updates.append('display_name')
+            if updates:
+                changed_users.append(user)
+                changed_fields.update(updates)
+
+            avatar_url = record.get('avatar_url')
+            profile = getattr(user, 'profile', None)
+            if avatar_url and profile and profile.avatar_url != avatar_url:
+                profile.avatar_url = avatar_url
+                avatar_profiles.append(profile)
+
+        created = User.objects.bulk_create(new_users)
+        if changed_users:
+            User.objects.bulk_update(changed_users, sorted(changed_fields))
+        if avatar_profiles:
+            UserProfile.objects.bulk_update(avatar_profiles, ['avatar_url'])
+
+        if created:
+            avatars = {
+                r['supabase_id']: r.get('avatar_url') or '' for r in records
+            }
+            UserProfile.objects.bulk_create([
+                UserProfile(user=user, avatar_url=avatars[user.supabase_id])
+                for user in created
+            ])
+            RoleService.bulk_assign_role(
+                [user.pk for user in created],
+                role_name=UserRole.STUDENT.value,
+                assigned_by=None
+            )
+
+        by_id = {user.supabase_id: user for user in created}
+        by_id.update(existing)
+        return [by_id[record['supabase_id']] for record in records]
+
+    @staticmethod
     def update_profile(
         user: User,
         **profile_data
     ) -> UserProfile:
         """
         Update user profile information.
-        
+        The common case (profile exists) is one UPDATE with no prior
+        fetch; a row is only created when the UPDATE matches nothing.
+
         Args:
             user: User whose profile to update
             **profile_data: Profile fields to update (bio, location, website, etc.)
-            
+
         Returns:
             Updated UserProfile instance
-            
+
         Raises:
             ValidationError: If profile data is invalid
         """
-        profile, created = UserProfile.objects.get_or_create(user=user)
-        
-        # Allowed profile fields
-        allowed_fields = [
-            'bio', 'location', 'website', 'github_username', 'linkedin_url'
-        ]
-        
-        # Update only allowed fields
-        updated_fields = []
-        for field, value in profile_data.items():
-            if field in allowed_fields:
-                setattr(profile, field, value)
-                updated_fields.append(field)
-        
-        if updated_fields:
-            profile.save(update_fields=updated_fields)
-        
-        return profile
+        filtered = {
+            field: value for field, value in profile_data.items()
+            if field in _ALLOWED_PROFILE_FIELDS
+        }
+        if not filtered:
+            profile, _ = UserProfile.objects.get_or_create(user=user)
+            return profile
+
+        updated = UserProfile.objects.filter(user=user).update(**filtered)
+        if not updated:
+            profile, created = UserProfile.objects.get_or_create(
+                user=user, defaults=filtered
+            )
+            if created:
+                return profile
+            # Lost the create race - apply the update to the winner's row
+            UserProfile.objects.filter(user=user).update(**filtered)
+        return UserProfile.objects.get(user=user)
     
     @staticmethod
     @transaction.atomic
@@ -162,6 +264,50 @@ class UserService:
         # Log the action
         AuditService.log_user_activation(user, activated_by)
     
+    @staticmethod
+    def list_users_fast(
+        role_name: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        List user summaries as plain dicts, bypassing model hydration.
+        values() skips User instance construction entirely and the role
+        names for the whole page come from one grouped query, so the
+        cost is two queries regardless of page size.
+
+        Args:
+            role_name: Optional role name to filter by
+            limit: Maximum number of users to return
+            offset: Number of users to skip
+
+        Returns:
+            List of dicts with id, email, display_name, created_at, roles
+        """
+        queryset = User.objects.filter(is_deleted=False).values(
+            'id', 'email', 'display_name', 'created_at'
+        )
+        if role_name:
+            queryset = queryset.filter(
+                Exists(
+                    UserRoleAssignment.objects.filter(
+                        user=OuterRef('pk'), role__name=role_name
+                    )
+                )
+            )
+        rows = list(queryset.order_by('-created_at')[offset:offset + limit])
+
+        roles_by_user: Dict[Any, List[str]] = {}
+        assignments = UserRoleAssignment.objects.filter(
+            user_id__in=[row['id'] for row in rows]
+        ).values_list('user_id', 'role__name')
+        for user_id, name in assignments:
+            roles_by_user.setdefault(user_id, []).append(name)
+
+        for row in rows:
+            row['roles'] = roles_by_user.get(row['id'], [])
+        return rows
+
     @staticmethod
     def get_user_statistics(user: User) -> Dict[str, int]:
         """
@@ -193,25 +339,54 @@ class UserService:
             }
     
     @staticmethod
-    @transaction.atomic
     def increment_statistic(user: User, stat_name: str, increment: int = 1) -> None:
         """
         Increment a user statistic.
         Used when user performs actions (bookmark, question, answer, etc.)
-        
+        Issues a single atomic UPDATE with an F() expression, so concurrent
+        increments never lose each other's writes.
+
         Args:
             user: User whose statistic to update
             stat_name: Name of statistic field
             increment: Amount to increment by (default 1)
         """
-        profile, created = UserProfile.objects.get_or_create(user=user)
-        
-        allowed_stats = [
-            'total_bookmarks', 'total_contributions', 'total_questions',
-            'total_answers', 'reputation_score'
-        ]
-        
-        if stat_name in allowed_stats:
-            current_value = getattr(profile, stat_name, 0)
-            setattr(profile, stat_name, current_value + increment)
-            profile.save(update_fields=[stat_name])
+        if stat_name not in _ALLOWED_STATS:
+            return
+
+        updated = UserProfile.objects.filter(user=user).update(
+            **{stat_name: F(stat_name) + increment}
+        )
+        if not updated:
+            # Profile missing (user created outside sync_from_supabase);
+            # create it with the increment already applied. On a concurrent
+            # create racing us, fall back to the atomic UPDATE.
+            _, created = UserProfile.objects.get_or_create(
+                user=user, defaults={stat_name: increment}
+            )
+            if not created:
+                UserProfile.objects.filter(user=user).update(
+                    **{stat_name: F(stat_name) + increment}
+                )
+
+    @staticmethod
+    def bulk_increment(user_ids, stat_name: str, increment: int = 1) -> int:
+        """
+        Increment one statistic for many users in a single UPDATE.
+        Used for batch events (e.g. awarding reputation to all answerers
+        of a question) instead of one increment_statistic call per user.
+
+        Args:
+            user_ids: Iterable of user IDs whose statistic to update
+            stat_name: Name of statistic field
+            increment: Amount to increment by (default 1)
+
+        Returns:
+            Number of profiles updated
+        """
+        if stat_name not in _ALLOWED_STATS:
+            return 0
+
+        return UserProfile.objects.filter(user_id__in=user_ids).update(
+            **{stat_name: F(stat_name) + increment}
+        )
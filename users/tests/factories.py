@@ -7,6 +7,23 @@ import uuid
 
 fake = Faker()
 
+# Role rows are created by migrations and survive per-test transactions,
+# so one fetch per name serves the whole test run instead of a
+# get_or_create per generated user
+_role_cache = {}
+
+
+def _get_role(role_name: str) -> Role:
+    """Fetch (or create) a Role once per test run"""
+    role = _role_cache.get(role_name)
+    if role is None:
+        role, _ = Role.objects.get_or_create(
+            name=role_name,
+            defaults={'description': f'{role_name.title()} role'}
+        )
+        _role_cache[role_name] = role
+    return role
+
 
 class RoleFactory(DjangoModelFactory):
     """Factory for Role model"""
@@ -37,14 +54,77 @@ class UserFactory(DjangoModelFactory):
         if not create:
             return
         
-        student_role, _ = Role.objects.get_or_create(
-            name=UserRole.STUDENT.value,
-            defaults={'description': 'Student role'}
-        )
         UserRoleAssignment.objects.get_or_create(
             user=obj,
-            role=student_role
+            role=_get_role(UserRole.STUDENT.value)
+        )
+
+    @classmethod
+    def create_batch_with_role(cls, size: int, role_name: str) -> list:
+        """
+        Create many users with one role in three queries total.
+        create_batch runs ~3 queries per user (insert + role
+        get_or_create + assignment get_or_create); bulk-creating the
+        users and their assignments keeps large test fixtures cheap.
+
+        Args:
+            size: Number of users to create
+            role_name: Role name from UserRole enum
+
+        Returns:
+            List of created User instances
+        """
+        users = User.objects.bulk_create([
+            cls.build() for _ in range(size)
+        ])
+        role = _get_role(role_name)
+        UserRoleAssignment.objects.bulk_create(
+            [UserRoleAssignment(user=user, role=role) for user in users],
+            ignore_conflicts=True
         )
+        return users
+
+
+def bulk_make_users(count=0, overrides=None, role_name=UserRole.STUDENT.value,
+                    **defaults):
+    """
+    Create users with profiles and a role in three INSERTs total.
+    A UserFactory loop costs ~3 queries per user; this builds everything
+    unsaved and bulk_creates users, profiles and role assignments once,
+    which dominates runtime in DB-bound list/pagination tests.
+
+    Args:
+        count: Number of users to create (ignored when overrides given)
+        overrides: Optional list of per-user field dicts
+        role_name: Role assigned to every created user
+        **defaults: Field values applied to every user
+
+    Returns:
+        List of created User instances
+    """
+    if overrides is None:
+        overrides = [{} for _ in range(count)]
+
+    built = []
+    for spec in overrides:
+        kwargs = {
+            'supabase_id': str(uuid.uuid4()),
+            'email': fake.email(),
+            'display_name': fake.name(),
+            'is_active': True,
+        }
+        kwargs.update(defaults)
+        kwargs.update(spec)
+        built.append(User(**kwargs))
+
+    users = User.objects.bulk_create(built)
+    UserProfile.objects.bulk_create([UserProfile(user=user) for user in users])
+    role = _get_role(role_name)
+    UserRoleAssignment.objects.bulk_create(
+        [UserRoleAssignment(user=user, role=role) for user in users],
+        ignore_conflicts=True
+    )
+    return users
 
 
 class UserProfileFactory(DjangoModelFactory):
@@ -86,13 +166,9 @@ class InstructorUserFactory(UserFactory):
         if not create:
             return
         
-        instructor_role, _ = Role.objects.get_or_create(
-            name=UserRole.INSTRUCTOR.value,
-            defaults={'description': 'Instructor role'}
-        )
         UserRoleAssignment.objects.get_or_create(
             user=obj,
-            role=instructor_role
+            role=_get_role(UserRole.INSTRUCTOR.value)
         )
 
 
@@ -105,11 +181,7 @@ class AdminUserFactory(UserFactory):
         if not create:
             return
         
-        admin_role, _ = Role.objects.get_or_create(
-            name=UserRole.ADMIN.value,
-            defaults={'description': 'Admin role'}
-        )
         UserRoleAssignment.objects.get_or_create(
             user=obj,
-            role=admin_role
+            role=_get_role(UserRole.ADMIN.value)
         )
@@ -1,57 +1,109 @@
 import pytest
 from rest_framework import status
-from django.urls import reverse
+from django.urls import reverse, reverse_lazy
 from users.models import User
-from users.tests.factories import UserFactory
+from users.tests.factories import UserFactory, bulk_make_users
 from core.constants import UserRole
 
 
-@pytest.mark.django_db
+# Default transactional db access for every test in this module;
+# per-test cost stays a savepoint rollback (never transaction=True
+# here - that escalates to a flush/truncate between tests)
+pytestmark = pytest.mark.django_db
+
+# Static endpoints resolved once per module instead of walking the URL
+# resolver inside every test; reverse_lazy defers until the URL conf is
+# loaded. Detail URLs with per-test pks still use reverse() inline.
+USER_LIST_URL = reverse_lazy('users:user-list')
+USER_ME_URL = reverse_lazy('users:user-me')
+USER_UPDATE_PROFILE_URL = reverse_lazy('users:user-update-profile')
+ROLE_LIST_URL = reverse_lazy('users:role-list')
+ROLE_INITIALIZE_URL = reverse_lazy('users:role-initialize')
+
+
 class TestUserViewSet:
     """Test UserViewSet endpoints"""
     
-    def test_list_users_as_admin(self, admin_client, student_user, instructor_user):
-        """Test that admins can list users"""
-        url = reverse('users:user-list')
-        response = admin_client.get(url)
-        
-        assert response.status_code == status.HTTP_200_OK
-        assert len(response.data['results']) >= 2
+    @pytest.mark.parametrize("client_fixture,expected_status", [
+        ("admin_client", status.HTTP_200_OK),
+        ("instructor_client", status.HTTP_403_FORBIDDEN),
+        ("student_client", status.HTTP_403_FORBIDDEN),
+    ])
+    def test_list_users_access(self, request, client_fixture, expected_status,
+                               student_user, instructor_user):
+        """Test the role matrix for listing users: admins only"""
+        client = request.getfixturevalue(client_fixture)
+        url = USER_LIST_URL
+        response = client.get(url)
+        
+        assert response.status_code == expected_status
+        if expected_status == status.HTTP_200_OK:
+            assert len(response.data['results']) >= 2
     
-    def test_list_users_as_student_denied(self, student_client):
-        """Test that students cannot list users"""
-        url = reverse('users:user-list')
-        response = student_client.get(url)
+    def test_list_users_query_count_constant(self, admin_client,
+                                             django_assert_max_num_queries):
+        """Test that the list query count doesn't grow with user count"""
+        bulk_make_users(10)
+        
+        url = USER_LIST_URL
+        with django_assert_max_num_queries(4):
+            response = admin_client.get(url)
         
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) >= 10
     
-    def test_retrieve_user(self, api_client, student_user):
+    def test_fast_list(self, admin_client):
+        """Test the serializer-free list and its limit/offset guards"""
+        bulk_make_users(3)
+        url = reverse('users:user-fast-list')
+
+        response = admin_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] >= 3
+        assert {'id', 'email', 'display_name', 'roles'} <= set(
+            response.data['results'][0]
+        )
+
+        # Negative limits clamp to zero instead of crashing the slice
+        response = admin_client.get(url, {'limit': '-5'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'] == []
+
+        response = admin_client.get(url, {'limit': 'lots'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_retrieve_user(self, api_client, student_user,
+                           django_assert_max_num_queries):
         """Test retrieving a single user (public)"""
         url = reverse('users:user-detail', kwargs={'pk': student_user.id})
-        response = api_client.get(url)
+        # One user+profile join plus the role prefetch
+        with django_assert_max_num_queries(3):
+            response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert response.data['email'] == student_user.email
         assert response.data['display_name'] == student_user.display_name
     
-    def test_me_endpoint_authenticated(self, student_client, student_user):
+    def test_me_endpoint_authenticated(self, student_client, student_user,
+                                       django_assert_max_num_queries):
         """Test /me endpoint for authenticated user"""
-        url = reverse('users:user-me')
-        response = student_client.get(url)
+        url = USER_ME_URL
+        with django_assert_max_num_queries(3):
+            response = student_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert response.data['email'] == student_user.email
     
     def test_me_endpoint_unauthenticated(self, api_client):
         """Test /me endpoint returns 401 for unauthenticated"""
-        url = reverse('users:user-me')
+        url = USER_ME_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
     def test_update_profile(self, student_client):
         """Test updating user profile"""
-        url = reverse('users:user-update-profile')
+        url = USER_UPDATE_PROFILE_URL
         data = {
             'bio': 'Updated bio',
             'location': 'New York',
@@ -65,32 +117,68 @@ class TestUserViewSet:
     
     def test_update_profile_unauthenticated(self, api_client):
         """Test that unauthenticated users cannot update profile"""
-        url = reverse('users:user-update-profile')
+        url = USER_UPDATE_PROFILE_URL
         data = {'bio': 'Test'}
         response = api_client.patch(url, data, format='json')
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
-    def test_assign_role_as_admin(self, admin_client, student_user):
-        """Test assigning role as admin"""
+    @pytest.mark.parametrize("client_fixture,expected_status", [
+        ("admin_client", status.HTTP_200_OK),
+        ("instructor_client", status.HTTP_403_FORBIDDEN),
+        ("student_client", status.HTTP_403_FORBIDDEN),
+    ])
+    def test_assign_role_access(self, request, client_fixture, expected_status,
+                                student_user):
+        """Test the role matrix for assigning roles: admins only"""
+        client = request.getfixturevalue(client_fixture)
         url = reverse('users:user-assign-role', kwargs={'pk': student_user.id})
         data = {'role_name': UserRole.INSTRUCTOR.value}
-        response = admin_client.post(url, data, format='json')
+        response = client.post(url, data, format='json')
         
-        assert response.status_code == status.HTTP_200_OK
-        assert 'assigned' in response.data['detail'].lower()
+        assert response.status_code == expected_status
         
         student_user.refresh_from_db()
-        assert student_user.has_role(UserRole.INSTRUCTOR.value)
+        assigned = expected_status == status.HTTP_200_OK
+        if assigned:
+            assert 'assigned' in response.data['detail'].lower()
+        assert student_user.has_role(UserRole.INSTRUCTOR.value) is assigned
     
-    def test_assign_role_as_student_denied(self, student_client, instructor_user):
-        """Test that students cannot assign roles"""
-        url = reverse('users:user-assign-role', kwargs={'pk': instructor_user.id})
-        data = {'role_name': UserRole.ADMIN.value}
-        response = student_client.post(url, data, format='json')
+    def test_bulk_assign_roles(self, admin_client, django_assert_max_num_queries):
+        """Test bulk role assignment runs as one batch, reporting bad ids"""
+        import uuid
+        users = bulk_make_users(3)
+        missing_id = str(uuid.uuid4())
+        
+        url = reverse('users:user-bulk-assign-roles')
+        data = {
+            'user_ids': [str(user.id) for user in users] + [missing_id],
+            'role_name': UserRole.INSTRUCTOR.value,
+        }
+        # Permission check + user lookup + duplicate check-free INSERT;
+        # a per-user assign loop would scale with the batch size
+        with django_assert_max_num_queries(6):
+            response = admin_client.post(url, data, format='json')
         
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data['results']
+        assert set(results['success']) == {str(user.id) for user in users}
+        assert results['failed'] == [
+            {'user_id': missing_id, 'reason': 'User not found'}
+        ]
+        for user in users:
+            assert user.has_role(UserRole.INSTRUCTOR.value)
     
+    def test_assign_role_non_dict_body(self, admin_client, student_user):
+        """Test that a valid-JSON but non-dict body returns 400, not 500"""
+        url = reverse('users:user-assign-role', kwargs={'pk': student_user.id})
+        response = admin_client.post(
+            url, [UserRole.INSTRUCTOR.value], format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not student_user.has_role(UserRole.INSTRUCTOR.value)
+
     def test_assign_invalid_role(self, admin_client, student_user):
         """Test assigning invalid role returns error"""
         url = reverse('users:user-assign-role', kwargs={'pk': student_user.id})
@@ -148,13 +236,12 @@ class TestUserViewSet:
         assert inactive_user.is_active is True
 
 
-@pytest.mark.django_db
 class TestRoleViewSet:
     """Test RoleViewSet endpoints"""
     
     def test_list_roles(self, api_client):
         """Test listing roles (public endpoint)"""
-        url = reverse('users:role-list')
+        url = ROLE_LIST_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -163,61 +250,63 @@ class TestRoleViewSet:
     def test_retrieve_role(self, api_client):
         """Test retrieving a single role"""
         from users.models import Role
-        role = Role.objects.first()
-        
+        # Indexed unique lookup instead of an insert-order-dependent first()
+        role = Role.objects.get(name=UserRole.STUDENT.value)
+
         url = reverse('users:role-detail', kwargs={'pk': role.id})
         response = api_client.get(url)
-        
+
         assert response.status_code == status.HTTP_200_OK
         assert response.data['name'] == role.name
     
-    def test_initialize_roles_as_admin(self, admin_client):
-        """Test initializing default roles as admin"""
-        url = reverse('users:role-initialize')
-        response = admin_client.post(url)
-        
-        assert response.status_code == status.HTTP_200_OK
-        assert len(response.data['roles']) == len(UserRole)
-    
-    def test_initialize_roles_as_student_denied(self, student_client):
-        """Test that students cannot initialize roles"""
-        url = reverse('users:role-initialize')
-        response = student_client.post(url)
-        
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+    @pytest.mark.parametrize("client_fixture,expected_status", [
+        ("admin_client", status.HTTP_200_OK),
+        ("instructor_client", status.HTTP_403_FORBIDDEN),
+        ("student_client", status.HTTP_403_FORBIDDEN),
+    ])
+    def test_initialize_roles_access(self, request, client_fixture,
+                                     expected_status):
+        """Test the role matrix for initializing roles: admins only"""
+        client = request.getfixturevalue(client_fixture)
+        url = ROLE_INITIALIZE_URL
+        response = client.post(url)
+        
+        assert response.status_code == expected_status
+        if expected_status == status.HTTP_200_OK:
+            assert len(response.data['roles']) == len(UserRole)
 
 
-@pytest.mark.django_db
 class TestAuthentication:
     """Test authentication middleware behavior"""
     
     def test_unauthenticated_request(self, api_client):
         """Test that requests without token have no user"""
-        url = reverse('users:user-me')
+        url = USER_ME_URL
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
     def test_authenticated_request(self, student_client, student_user):
         """Test that authenticated requests have user"""
-        url = reverse('users:user-me')
+        url = USER_ME_URL
         response = student_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert response.data['id'] == str(student_user.id)
 
 
-@pytest.mark.django_db
 class TestPagination:
     """Test API pagination"""
     
     def test_users_list_pagination(self, admin_client):
         """Test that user list is paginated"""
-        # Create 25 users to exceed default page size
-        for i in range(25):
-            UserFactory(email=f"user{i}@example.com")
+        # Create 25 users to exceed default page size - three INSERTs
+        # total instead of a factory dispatch per user
+        bulk_make_users(
+            overrides=[{'email': f"user{i}@example.com"} for i in range(25)]
+        )
         
-        url = reverse('users:user-list')
+        url = USER_LIST_URL
         response = admin_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -227,16 +316,17 @@ class TestPagination:
         assert 'previous' in response.data
 
 
-@pytest.mark.django_db
 class TestFiltering:
     """Test API filtering"""
     
     def test_filter_by_active_status(self, admin_client):
         """Test filtering users by is_active"""
-        UserFactory(is_active=True, email="active@example.com")
-        UserFactory(is_active=False, email="inactive@example.com")
+        bulk_make_users(overrides=[
+            {'is_active': True, 'email': "active@example.com"},
+            {'is_active': False, 'email': "inactive@example.com"},
+        ])
         
-        url = reverse('users:user-list')
+        url = USER_LIST_URL
         response = admin_client.get(url, {'is_active': 'true'})
         
         assert response.status_code == status.HTTP_200_OK
@@ -247,10 +337,12 @@ class TestFiltering:
     
     def test_search_users(self, admin_client):
         """Test searching users by email/display_name"""
-        UserFactory(email="john@example.com", display_name="John Doe")
-        UserFactory(email="jane@example.com", display_name="Jane Smith")
+        bulk_make_users(overrides=[
+            {'email': "john@example.com", 'display_name': "John Doe"},
+            {'email': "jane@example.com", 'display_name': "Jane Smith"},
+        ])
         
-        url = reverse('users:user-list')
+        url = USER_LIST_URL
         response = admin_client.get(url, {'search': 'john'})
         
         assert response.status_code == status.HTTP_200_OK
@@ -8,6 +8,12 @@ from users.tests.factories import UserFactory
 from core.constants import UserRole
 
 
+# Default transactional db access for every test in this module;
+# per-test cost stays a savepoint rollback (never transaction=True
+# here - that escalates to a flush/truncate between tests)
+pytestmark = pytest.mark.django_db
+
+
 class DummyView:
     """Dummy view for permission testing"""
     pass
@@ -19,7 +25,6 @@ class DummyObject:
         self.user = user
 
 
-@pytest.mark.django_db
 class TestIsAuthenticatedUser:
     """Test IsAuthenticatedUser permission"""
     
@@ -42,7 +47,6 @@ class TestIsAuthenticatedUser:
         assert not permission.has_permission(request, DummyView())
 
 
-@pytest.mark.django_db
 class TestIsStudent:
     """Test IsStudent permission"""
     
@@ -87,7 +91,6 @@ class TestIsStudent:
         assert not permission.has_permission(request, DummyView())
 
 
-@pytest.mark.django_db
 class TestIsInstructor:
     """Test IsInstructor permission"""
     
@@ -119,7 +122,6 @@ class TestIsInstructor:
         assert not permission.has_permission(request, DummyView())
 
 
-@pytest.mark.django_db
 class TestIsAdmin:
     """Test IsAdmin permission"""
     
@@ -151,7 +153,6 @@ class TestIsAdmin:
         assert not permission.has_permission(request, DummyView())
 
 
-@pytest.mark.django_db
 class TestIsOwnerOrAdmin:
     """Test IsOwnerOrAdmin permission"""
     
@@ -189,7 +190,6 @@ class TestIsOwnerOrAdmin:
         assert permission.has_object_permission(request, DummyView(), obj)
 
 
-@pytest.mark.django_db
 class TestIsOwnerOrReadOnly:
     """Test IsOwnerOrReadOnly permission"""
     
@@ -234,7 +234,6 @@ class TestIsOwnerOrReadOnly:
         assert not permission.has_object_permission(request, DummyView(), obj)
 
 
-@pytest.mark.django_db
 class TestCanManageContent:
     """Test CanManageContent permission"""
     
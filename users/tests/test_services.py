@@ -3,12 +3,17 @@ from django.core.exceptions import PermissionDenied
 from users.services.role_service import RoleService
 from users.services.user_service import UserService
 from users.models import User, Role, UserRoleAssignment, UserProfile
-from users.tests.factories import UserFactory
+from users.tests.factories import UserFactory, bulk_make_users
 from core.constants import UserRole
 from core.exceptions import ValidationError, PermissionDeniedError
 
 
-@pytest.mark.django_db
+# Default transactional db access for every test in this module;
+# per-test cost stays a savepoint rollback (never transaction=True
+# here - that escalates to a flush/truncate between tests)
+pytestmark = pytest.mark.django_db
+
+
 class TestRoleService:
     """Test RoleService"""
     
@@ -93,6 +98,77 @@ class TestRoleService:
                 revoked_by=student_user
             )
     
+    def test_bulk_assign_role(self, admin_user):
+        """Test assigning one role to many users in a single batch"""
+        users = bulk_make_users(3)
+        
+        count = RoleService.bulk_assign_role(
+            [user.id for user in users],
+            role_name=UserRole.INSTRUCTOR.value,
+            assigned_by=admin_user
+        )
+        
+        assert count == 3
+        for user in users:
+            assert user.has_role(UserRole.INSTRUCTOR.value)
+        
+        # Idempotent: re-assigning must not duplicate assignments
+        RoleService.bulk_assign_role(
+            [user.id for user in users],
+            role_name=UserRole.INSTRUCTOR.value,
+            assigned_by=admin_user
+        )
+        instructor_role = Role.objects.get(name=UserRole.INSTRUCTOR.value)
+        assert UserRoleAssignment.objects.filter(
+            user__in=users, role=instructor_role
+        ).count() == 3
+    
+    def test_bulk_assign_role_invalid_name(self, admin_user):
+        """Test bulk assigning an invalid role raises error"""
+        with pytest.raises(ValidationError):
+            RoleService.bulk_assign_role(
+                [admin_user.id],
+                role_name="invalid_role",
+                assigned_by=admin_user
+            )
+    
+    def test_bulk_assign_role_permission_denied(self, student_user, instructor_user):
+        """Test that non-admins cannot bulk assign roles"""
+        with pytest.raises(PermissionDeniedError):
+            RoleService.bulk_assign_role(
+                [instructor_user.id],
+                role_name=UserRole.ADMIN.value,
+                assigned_by=student_user
+            )
+    
+    def test_bulk_revoke_role(self, admin_user):
+        """Test revoking one role from many users in a single batch"""
+        users = bulk_make_users(3)
+        RoleService.bulk_assign_role(
+            [user.id for user in users],
+            role_name=UserRole.INSTRUCTOR.value,
+            assigned_by=admin_user
+        )
+        
+        revoked = RoleService.bulk_revoke_role(
+            [user.id for user in users],
+            role_name=UserRole.INSTRUCTOR.value,
+            revoked_by=admin_user
+        )
+        
+        assert revoked == 3
+        for user in users:
+            assert not user.has_role(UserRole.INSTRUCTOR.value)
+    
+    def test_bulk_revoke_role_permission_denied(self, student_user, instructor_user):
+        """Test that non-admins cannot bulk revoke roles"""
+        with pytest.raises(PermissionDeniedError):
+            RoleService.bulk_revoke_role(
+                [instructor_user.id],
+                role_name=UserRole.INSTRUCTOR.value,
+                revoked_by=student_user
+            )
+    
     def test_can_assign_role(self, admin_user, student_user):
         """Test can_assign_role permission check"""
         assert RoleService.can_assign_role(admin_user, UserRole.INSTRUCTOR.value)
@@ -141,7 +217,6 @@ class TestRoleService:
         assert Role.objects.filter(name=UserRole.ADMIN.value).exists()
 
 
-@pytest.mark.django_db
 class TestUserService:
     """Test UserService"""
     
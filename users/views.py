@@ -9,12 +9,13 @@ from django_filters.rest_framework import DjangoFilterBackend, FilterSet, CharFi
 from rest_framework.filters import SearchFilter, OrderingFilter
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.http import HttpResponse
 
 from users.models import User, Role, UserProfile
 from users.serializers import (
     UserSerializer, UserDetailSerializer, RoleSerializer,
-    UserProfileSerializer, AssignRoleSerializer, UpdateProfileSerializer
+    UserProfileSerializer, validate_assign_role, validate_update_profile
 )
 from users.permissions import IsAdmin, IsAuthenticatedUser, IsOwnerOrAdmin
 from users.services.user_service import UserService
@@ -85,7 +86,7 @@ class UserViewSet(viewsets.ModelViewSet):
             'list', 'update', 'partial_update', 'destroy',
             'assign_role', 'revoke_role', 'deactivate', 'activate', 'restore',
             'audit_log', 'bulk_assign_roles', 'bulk_activate', 'bulk_deactivate', 'export',
-            'reset_password', 'update_email', 'send_verification'
+            'reset_password', 'update_email', 'send_verification', 'fast_list'
         ]
         
         if self.action in admin_actions:
@@ -104,16 +105,43 @@ class UserViewSet(viewsets.ModelViewSet):
         if self.action != 'restore':
             queryset = queryset.filter(is_deleted=False)
         
-        # Prefetch roles for list view
+        # Let the serializer declare what it reads: roles for lists,
+        # roles + profile for detail views
         if self.action == 'list':
-            queryset = queryset.with_roles()
-        
-        # Prefetch profile for detail view
+            queryset = UserSerializer.setup_eager_loading(queryset)
+
         if self.action in ['retrieve', 'me']:
-            queryset = queryset.select_related('profile')
-        
+            queryset = UserDetailSerializer.setup_eager_loading(queryset)
+
         return queryset
     
+    @action(detail=False, methods=['get'], url_path='fast-list')
+    def fast_list(self, request):
+        """
+        Serializer-free user summary list for admin tooling.
+        Returns plain dicts straight from the database - no User
+        instances, no DRF serializer construction.
+
+        GET /api/users/fast-list/?role=student&limit=50&offset=0
+        """
+        try:
+            # Clamp to [0, 200]: a negative limit would hit queryset
+            # slicing, which rejects negative indexes with a 500
+            limit = max(min(int(request.query_params.get('limit', 50)), 200), 0)
+            offset = max(int(request.query_params.get('offset', 0)), 0)
+        except (TypeError, ValueError):
+            return Response(
+                {'detail': 'limit and offset must be integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        rows = UserService.list_users_fast(
+            role_name=request.query_params.get('role'),
+            limit=limit,
+            offset=offset
+        )
+        return Response({'count': len(rows), 'results': rows})
+
     @action(detail=False, methods=['get'], url_path='me')
     def me(self, request):
         """
@@ -144,13 +172,12 @@ class UserViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        serializer = UpdateProfileSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        
+        validated_data = validate_update_profile(request.data)
+
         # Update profile using service
         profile = UserService.update_profile(
             user=request.user,
-            **serializer.validated_data
+            **validated_data
         )
         
         profile_serializer = UserProfileSerializer(profile)
@@ -165,18 +192,17 @@ class UserViewSet(viewsets.ModelViewSet):
         Body: {role_name: 'instructor'}
         """
         user = self.get_object()
-        serializer = AssignRoleSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        
+        role_name = validate_assign_role(request.data)['role_name']
+
         try:
             assignment = RoleService.assign_role(
                 user=user,
-                role_name=serializer.validated_data['role_name'],
+                role_name=role_name,
                 assigned_by=request.user
             )
             
             return Response({
-                'detail': f'Role {serializer.validated_data["role_name"]} assigned to {user.display_name}',
+                'detail': f'Role {role_name} assigned to {user.display_name}',
                 'user': UserDetailSerializer(user).data
             })
         except (ValidationError, PermissionDeniedError) as e:
@@ -194,19 +220,18 @@ class UserViewSet(viewsets.ModelViewSet):
         Body: {role_name: 'instructor'}
         """
         user = self.get_object()
-        serializer = AssignRoleSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        
+        role_name = validate_assign_role(request.data)['role_name']
+
         try:
             revoked = RoleService.revoke_role(
                 user=user,
-                role_name=serializer.validated_data['role_name'],
+                role_name=role_name,
                 revoked_by=request.user
             )
             
             if revoked:
                 return Response({
-                    'detail': f'Role {serializer.validated_data["role_name"]} revoked from {user.display_name}',
+                    'detail': f'Role {role_name} revoked from {user.display_name}',
                     'user': UserDetailSerializer(user).data
                 })
             else:
@@ -406,25 +431,52 @@ class UserViewSet(viewsets.ModelViewSet):
         """
         user_ids = request.data.get('user_ids', [])
         role_name = request.data.get('role_name')
-        
+
         if not user_ids or not role_name:
             return Response(
                 {'detail': 'user_ids and role_name are required'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        
-        results = {'success': [], 'failed': []}
-        
-        for user_id in user_ids:
+
+        # Resolve existing users in one query so unknown ids are still
+        # reported, then hand the whole batch to the bulk service path
+        # (one INSERT and one audit entry instead of a loop of
+        # per-user transactions)
+        try:
+            found_ids = {
+                str(pk) for pk in User.objects.filter(
+                    pk__in=user_ids
+                ).values_list('pk', flat=True)
+            }
+        except (ValueError, DjangoValidationError):
+            return Response(
+                {'detail': 'user_ids must be valid user UUIDs'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results = {
+            'success': [],
+            'failed': [
+                {'user_id': str(user_id), 'reason': 'User not found'}
+                for user_id in user_ids if str(user_id) not in found_ids
+            ],
+        }
+
+        if found_ids:
             try:
-                user = User.objects.get(pk=user_id)
-                RoleService.assign_role(user, role_name, request.user)
-                results['success'].append(str(user_id))
-            except User.DoesNotExist:
-                results['failed'].append({'user_id': str(user_id), 'reason': 'User not found'})
-            except Exception as e:
-                results['failed'].append({'user_id': str(user_id), 'reason': str(e)})
-        
+                RoleService.bulk_assign_role(
+                    found_ids, role_name, assigned_by=request.user
+                )
+            except (ValidationError, PermissionDeniedError) as e:
+                return Response(
+                    {'detail': str(e)},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            results['success'] = [
+                str(user_id) for user_id in user_ids
+                if str(user_id) in found_ids
+            ]
+
         return Response({
             'detail': f'Bulk role assignment completed',
             'results': results